@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 from dataclasses import dataclass, replace
 from functools import lru_cache
@@ -93,6 +94,28 @@ def get_token_verifier() -> SupabaseTokenVerifier:
     return SupabaseTokenVerifier(get_settings())
 
 
+_inflight_verifications: dict[str, asyncio.Task[RequestAuthContext]] = {}
+
+
+def _forget_verification(token: str, task: asyncio.Task[RequestAuthContext]) -> None:
+    if _inflight_verifications.get(token) is task:
+        del _inflight_verifications[token]
+    if not task.cancelled():
+        task.exception()
+
+
+async def verify_access_token(token: str) -> RequestAuthContext:
+    # Supabase `get_user` is a blocking network call; keep it off the event loop and
+    # let concurrent requests carrying the same token share a single lookup.
+    task = _inflight_verifications.get(token)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        verifier = get_token_verifier()
+        task = asyncio.ensure_future(asyncio.to_thread(verifier.verify, token))
+        _inflight_verifications[token] = task
+        task.add_done_callback(lambda done: _forget_verification(token, done))
+    return await asyncio.shield(task)
+
+
 async def is_access_token_revoked(token: str, settings: Settings | None = None) -> bool:
     settings = settings or get_settings()
     if settings.env in {"test", "dev"}:
@@ -124,8 +147,7 @@ async def require_request_auth_context(
     authorization: str | None = Header(default=None),
 ) -> RequestAuthContext:
     token = extract_bearer_token(authorization)
-    verifier = get_token_verifier()
-    context = verifier.verify(token)
+    context = await verify_access_token(token)
     try:
         revoked = await is_access_token_revoked(token)
     except Exception as exc:
@@ -143,9 +165,8 @@ async def require_request_auth_context_from_session_cookie(
     session_token = request.cookies.get(SESSION_COOKIE_NAME)
     if session_token is None or not session_token.strip():
         raise MissingCredentialsError()
-    verifier = get_token_verifier()
     token = session_token.strip()
-    context = verifier.verify(token)
+    context = await verify_access_token(token)
     try:
         revoked = await is_access_token_revoked(token)
     except Exception as exc:
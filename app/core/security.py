@@ -3,10 +3,12 @@ from __future__ import annotations
 import asyncio
 import ipaddress
 import logging
+import re
 import time
 import uuid
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
 from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -19,6 +21,7 @@ from app.services.supabase_rest import SupabaseRestRepository, response_json
 
 logger = logging.getLogger(__name__)
 SESSION_COOKIE_NAME = "writior_session"
+_CONTROL_CHAR_RE = re.compile(r"[\x00-\x1f]")
 
 
 class RouteAccess(str, Enum):
@@ -84,16 +87,19 @@ class RouteClassifier:
             ("/api/activity", RouteAccess.AUTH_REQUIRED),
             ("/api/extension/", RouteAccess.AUTH_REQUIRED),
         )
+        self._prefix_access = dict(self._prefix_rules)
+        self._prefix_pattern = re.compile("|".join(re.escape(prefix) for prefix, _ in self._prefix_rules))
 
     def classify(self, path: str) -> RouteAccess:
         if path in self._exact_rules:
             return self._exact_rules[path]
-        for prefix, access in self._prefix_rules:
-            if path.startswith(prefix):
-                return access
+        match = self._prefix_pattern.match(path)
+        if match:
+            return self._prefix_access[match.group(0)]
         return RouteAccess.PUBLIC
 
 
+@lru_cache(maxsize=1)
 def get_route_classifier() -> RouteClassifier:
     return RouteClassifier()
 
@@ -112,7 +118,7 @@ def validate_internal_redirect_path(path: str | None) -> str:
         raise UnsafeRedirectError()
     if "\\" in candidate:
         raise UnsafeRedirectError()
-    if any(ord(char) < 32 for char in candidate):
+    if _CONTROL_CHAR_RE.search(candidate):
         raise UnsafeRedirectError()
     if "://" in candidate:
         raise UnsafeRedirectError()
@@ -331,10 +337,10 @@ def install_security_middleware(app: FastAPI, settings: Settings | None = None)
         request.state.request_id = request_id
         request.state.route_access = app.state.route_classifier.classify(request.url.path)
         set_request_context(request_id=request_id, route=request.url.path)
-        start = time.perf_counter()
+        start = time.perf_counter_ns()
         try:
             response = await call_next(request)
-            latency_ms = round((time.perf_counter() - start) * 1000, 2)
+            latency_ms = round((time.perf_counter_ns() - start) / 1_000_000, 2)
             request.state.response_status = response.status_code
             set_request_context(status=response.status_code, latency_ms=latency_ms)
             logger.info("request.completed", extra={"status": response.status_code, "latency_ms": latency_ms})
@@ -5,6 +5,7 @@ import os
 import re
 import sys
 import time
+from functools import lru_cache
 from typing import Any
 
 _request_context: contextvars.ContextVar[dict[str, Any]] = contextvars.ContextVar(
@@ -23,20 +24,44 @@ SENSITIVE_KEY_PARTS = (
     "handoff_code",
     "code",
 )
-
-SENSITIVE_VALUE_PATTERNS = [
-    re.compile(r"(?i)(bearer\s+)[A-Za-z0-9._\-~+/]+=*"),
-    re.compile(r"(?i)(token=)[^\s&]+"),
-    re.compile(r"(?i)(refresh[_-]?token=)[^\s&]+"),
-    re.compile(r"(?i)(secret=)[^\s&]+"),
-    re.compile(r"(?i)(code=)[^\s&]+"),
-]
-
+SENSITIVE_KEY_PATTERN = re.compile("|".join(re.escape(part) for part in SENSITIVE_KEY_PARTS))
+
+# Bearer credentials are scrubbed in their own pass first: a key=value match only
+# consumes up to the next space, so "token=Bearer <jwt>" would otherwise leak the jwt.
+BEARER_VALUE_PATTERN = re.compile(r"(?i)(bearer\s+)[A-Za-z0-9._\-~+/]+=*")
+SENSITIVE_VALUE_PATTERN = re.compile(r"(?i)((?:refresh[_-]?token|token|secret|code)=)[^\s&]+")
+SENSITIVE_VALUE_MARKERS = ("bearer", "token=", "secret=", "code=")
+RESERVED_LOG_RECORD_KEYS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+        "taskName",
+        "message",
+    }
+)
 
 
+@lru_cache(maxsize=1024)
 def _is_sensitive_key(key: str) -> bool:
-    lowered = key.lower()
-    return any(part in lowered for part in SENSITIVE_KEY_PARTS)
+    return SENSITIVE_KEY_PATTERN.search(key.lower()) is not None
 
 
 
@@ -51,10 +76,13 @@ def redact_value(value: Any, *, key: str | None = None) -> Any:
         return [redact_value(v) for v in value]
 
     if isinstance(value, str):
-        redacted = value
-        for pattern in SENSITIVE_VALUE_PATTERNS:
-            redacted = pattern.sub(r"\1[REDACTED]", redacted)
-        return redacted
+        # casefold() maps the same Unicode variants the (?i) patterns accept (e.g. U+017F
+        # long s, U+212A Kelvin sign); lower() does not, and would skip "ſecret=..." here.
+        folded = value.casefold()
+        if not any(marker in folded for marker in SENSITIVE_VALUE_MARKERS):
+            return value
+        redacted = BEARER_VALUE_PATTERN.sub(r"\1[REDACTED]", value)
+        return SENSITIVE_VALUE_PATTERN.sub(r"\1[REDACTED]", redacted)
 
     return value
 
@@ -87,30 +115,7 @@ class JsonFormatter(logging.Formatter):
         payload["upstream"] = request_ctx.get("upstream")
 
         for key, value in record.__dict__.items():
-            if key in {
-                "name",
-                "msg",
-                "args",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-                "taskName",
-                "message",
-            }:
+            if key in RESERVED_LOG_RECORD_KEYS:
                 continue
             payload[key] = redact_value(value, key=key)
 
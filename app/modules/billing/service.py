@@ -378,7 +378,7 @@ class BillingService:
             raise BillingWebhookError("billing_webhook_invalid_signature", "Invalid webhook signature.", 400)
         expected = hmac.new(
             secret.encode("utf-8"),
-            f"{timestamp}:{raw_body.decode('utf-8')}".encode("utf-8"),
+            timestamp.encode("utf-8") + b":" + raw_body,
             hashlib.sha256,
         ).hexdigest()
         if not any(hmac.compare_digest(candidate, expected) for candidate in candidates):
@@ -386,7 +386,7 @@ class BillingService:
 
     def _payload_json(self, raw_body: bytes) -> dict[str, object]:
         try:
-            payload = json.loads(raw_body.decode("utf-8") or "{}")
+            payload = json.loads(raw_body or b"{}")
         except json.JSONDecodeError as exc:
             raise BillingWebhookError("billing_webhook_invalid_payload", "Invalid webhook payload.", 400) from exc
         if not isinstance(payload, dict):
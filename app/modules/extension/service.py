@@ -340,7 +340,7 @@ class ExtensionService:
             if len(parts) < 2:
                 return None
             payload = parts[1] + "=" * (-len(parts[1]) % 4)
-            claims = json.loads(base64.urlsafe_b64decode(payload.encode("ascii")).decode("utf-8"))
+            claims = json.loads(base64.urlsafe_b64decode(payload))
             exp = claims.get("exp")
             if not isinstance(exp, (int, float)):
                 return None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Request, Response
 
-from app.core.auth import RequestAuthContext, get_token_verifier, require_request_auth_context, require_request_auth_context_from_session_cookie
+from app.core.auth import RequestAuthContext, require_request_auth_context, require_request_auth_context_from_session_cookie, verify_access_token
 from app.core.config import get_settings
 from app.core.serialization import serialize_ok_envelope
 from app.core.security import clear_session_cookie, enforce_shared_auth_sensitive_rate_limit, set_session_cookie
@@ -61,7 +61,7 @@ async def get_web_session(
 
 @router.post("/api/auth/session")
 async def create_web_session(payload: AuthSessionCreateRequest, response: Response) -> dict[str, object]:
-    auth_context = get_token_verifier().verify(payload.access_token)
+    auth_context = await verify_access_token(payload.access_token)
     response.headers["Cache-Control"] = "no-store"
     set_session_cookie(response, payload.access_token, settings)
     return serialize_ok_envelope(
@@ -12,6 +12,18 @@ from app.services.supabase_rest import SupabaseRestRepository, response_error_co
 logger = logging.getLogger(__name__)
 
 
+def _render_log_fields(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "render_count": len(rows),
+        "render_kinds": sorted({str(row.get("render_kind") or "") for row in rows if row.get("render_kind")}),
+        "styles": sorted({str(row.get("style") or "") for row in rows if row.get("style")}),
+        "cache_keys": [str(row.get("cache_key") or "") for row in rows[:6]],
+        "source_versions": sorted({str(row.get("source_version") or "") for row in rows if row.get("source_version")}),
+        "citation_versions": sorted({str(row.get("citation_version") or "") for row in rows if row.get("citation_version")}),
+        "render_versions": sorted({int(row.get("render_version") or 0) for row in rows if row.get("render_version") is not None}),
+    }
+
+
 class CitationsRepository:
     def __init__(self, *, supabase_repo: SupabaseRestRepository, anon_key: str | None):
         self.supabase_repo = supabase_repo
@@ -137,20 +149,15 @@ class CitationsRepository:
         return payload if isinstance(payload, list) else []
 
     async def replace_renders(self, *, citation_id: str, source_id: str, rows: list[dict[str, Any]]) -> None:
-        logger.info(
-            "citations.replace_renders.attempt",
-            extra={
-                "citation_id": citation_id,
-                "source_id": source_id,
-                "render_count": len(rows),
-                "render_kinds": sorted({str(row.get("render_kind") or "") for row in rows if row.get("render_kind")}),
-                "styles": sorted({str(row.get("style") or "") for row in rows if row.get("style")}),
-                "cache_keys": [str(row.get("cache_key") or "") for row in rows[:6]],
-                "source_versions": sorted({str(row.get("source_version") or "") for row in rows if row.get("source_version")}),
-                "citation_versions": sorted({str(row.get("citation_version") or "") for row in rows if row.get("citation_version")}),
-                "render_versions": sorted({int(row.get("render_version") or 0) for row in rows if row.get("render_version") is not None}),
-            },
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "citations.replace_renders.attempt",
+                extra={
+                    "citation_id": citation_id,
+                    "source_id": source_id,
+                    **_render_log_fields(rows),
+                },
+            )
         delete_response = await self.supabase_repo.delete(
             "citation_renders",
             params={"citation_instance_id": f"eq.{citation_id}"},
@@ -171,13 +178,7 @@ class CitationsRepository:
                 extra={
                     "citation_id": citation_id,
                     "source_id": source_id,
-                    "render_count": len(rows),
-                    "render_kinds": sorted({str(row.get("render_kind") or "") for row in rows if row.get("render_kind")}),
-                    "styles": sorted({str(row.get("style") or "") for row in rows if row.get("style")}),
-                    "cache_keys": [str(row.get("cache_key") or "") for row in rows[:6]],
-                    "source_versions": sorted({str(row.get("source_version") or "") for row in rows if row.get("source_version")}),
-                    "citation_versions": sorted({str(row.get("citation_version") or "") for row in rows if row.get("citation_version")}),
-                    "render_versions": sorted({int(row.get("render_version") or 0) for row in rows if row.get("render_version") is not None}),
+                    **_render_log_fields(rows),
                     "upstream_code": response_error_code(insert_response) or None,
                     "upstream_detail": response_error_text(insert_response) or None,
                 },
@@ -76,7 +76,7 @@ def first_row(payload: Any) -> dict[str, Any] | None:
 
 
 def ensure_response_ok(response, *, detail: str, allowed: set[int] | tuple[int, ...] = (200,)) -> Any:
-    if response.status_code not in set(allowed):
+    if response.status_code not in allowed:
         raise HTTPException(status_code=500, detail=detail)
     return response_json(response)
 
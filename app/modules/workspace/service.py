@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 
+from bisect import bisect_left
 from datetime import datetime, timezone
 
 from fastapi import HTTPException
@@ -21,6 +22,35 @@ from app.modules.workspace.repo import WorkspaceRepository
 from app.services.supabase_rest import response_error_text
 
 
+_ANCHOR_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+_HEADING_OPEN_RE = re.compile(r"<h([1-6])[^>]*>", re.IGNORECASE)
+_HEADING_CLOSE_RE = re.compile(r"</h([1-6])>", re.IGNORECASE)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+OUTLINE_HEADING_MAX_CHARS = 4096
+
+
+def _html_headings(html: str) -> list[tuple[str, str]]:
+    # Same pairing as a lazy <hN>...</hN> regex, but each open tag looks up its closing
+    # tag in a precomputed index, so an unclosed heading never rescans the rest of the document.
+    close_starts: dict[str, list[int]] = {}
+    close_ends: dict[str, list[int]] = {}
+    for closed in _HEADING_CLOSE_RE.finditer(html):
+        close_starts.setdefault(closed.group(1), []).append(closed.start())
+        close_ends.setdefault(closed.group(1), []).append(closed.end())
+    headings: list[tuple[str, str]] = []
+    position = 0
+    while opened := _HEADING_OPEN_RE.search(html, position):
+        level = opened.group(1)
+        starts = close_starts.get(level, [])
+        index = bisect_left(starts, opened.end())
+        if index == len(starts):
+            position = opened.start() + 1
+            continue
+        headings.append((level, html[opened.end():starts[index]]))
+        position = close_ends[level][index]
+    return headings
+
+
 class WorkspaceService:
     def __init__(
         self,
@@ -690,12 +720,12 @@ class WorkspaceService:
             heading = attributes.get("header") if isinstance(attributes, dict) else None
             text = str(op.get("insert") or "").strip() if isinstance(op, dict) else ""
             if heading and text:
-                anchor = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "section"
+                anchor = _ANCHOR_SEPARATOR_RE.sub("-", text.lower()).strip("-") or "section"
                 items.append({"level": int(heading), "text": text, "anchor": anchor})
         if not items and document.get("content_html"):
-            for level, text in re.findall(r"<h([1-6])[^>]*>(.*?)</h\1>", str(document["content_html"]), flags=re.I | re.S):
-                plain = re.sub(r"<[^>]+>", "", text).strip()
+            for level, text in _html_headings(str(document["content_html"])):
+                plain = _HTML_TAG_RE.sub("", text).strip()[:OUTLINE_HEADING_MAX_CHARS]
                 if plain:
-                    anchor = re.sub(r"[^a-z0-9]+", "-", plain.lower()).strip("-") or "section"
+                    anchor = _ANCHOR_SEPARATOR_RE.sub("-", plain.lower()).strip("-") or "section"
                     items.append({"level": int(level), "text": plain, "anchor": anchor})
         return serialize_ok_envelope(serialize_outline(items))
@@ -3,27 +3,62 @@ from __future__ import annotations
 
 import httpx
 
-from app.services.resilience import DEFAULT_TIMEOUT, RetryPolicy, call_with_retries
+from app.services.resilience import (
+    DEFAULT_TIMEOUT,
+    OUTAGE_HTTP_STATUS,
+    TRANSIENT_HTTP_STATUS,
+    CircuitBreaker,
+    RetryPolicy,
+    call_with_retries,
+)
+
+SINGLE_ATTEMPT_POLICY = RetryPolicy(max_attempts=1)
 
 
 class ResilientAsyncClient(httpx.AsyncClient):
-    def __init__(self, *args, retry_policy: RetryPolicy | None = None, **kwargs):
+    def __init__(
+        self,
+        *args,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self._retry_policy = retry_policy or RetryPolicy(max_attempts=3, base_delay_s=0.2, max_delay_s=1.0, jitter_s=0.25)
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
 
     async def request(self, method: str, url, *args, **kwargs):  # type: ignore[override]
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-        return await call_with_retries(
-            lambda: super(ResilientAsyncClient, self).request(method, url, *args, **kwargs),
-            retry_policy=self._retry_policy,
-        )
+        host = httpx.URL(url).host or self.base_url.host
+        # While a host's breaker is open, fail fast with a single attempt instead of sleeping through retries.
+        retry_policy = SINGLE_ATTEMPT_POLICY if self._circuit_breaker.is_open(host) else self._retry_policy
+        try:
+            response = await call_with_retries(
+                lambda: super(ResilientAsyncClient, self).request(method, url, *args, **kwargs),
+                retry_policy=retry_policy,
+            )
+        except (httpx.TimeoutException, httpx.TransportError):
+            self._circuit_breaker.record_failure(host)
+            raise
+        # Only an outage status that survived the retries counts against the host; other transient
+        # statuses (throttling, request timeouts, application 500s) leave the breaker untouched.
+        if response.status_code in OUTAGE_HTTP_STATUS:
+            self._circuit_breaker.record_failure(host)
+        elif response.status_code not in TRANSIENT_HTTP_STATUS:
+            self._circuit_breaker.record_success(host)
+        return response
+
 
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_KEEPALIVE_EXPIRY_S = 30.0
 
 http_client = ResilientAsyncClient(
     timeout=DEFAULT_TIMEOUT,
     limits=httpx.Limits(
-        max_connections=20,
-        max_keepalive_connections=10
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_S,
     ),
     http2=True
 )
@@ -35,6 +35,14 @@ PUBLISHER_EQUIVALENTS = {
 
 PERSON_AUTHOR_DELIMITERS = re.compile(r"\s*(?:;|\|)\s*")
 DOI_PATTERN = re.compile(r"\b10\.\d{4,9}/[-._;()/:a-z0-9]+\b", re.IGNORECASE)
+DOI_URL_PREFIX_PATTERN = re.compile(r"^https?://(?:dx\.)?doi\.org/", re.IGNORECASE)
+DOI_LABEL_PREFIX_PATTERN = re.compile(r"^doi:\s*", re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+NON_ISBN_CHAR_PATTERN = re.compile(r"[^0-9Xx]")
+YEAR_PATTERN = re.compile(r"(19|20)\d{2}")
+ISO_DATE_PREFIX_PATTERN = re.compile(r"^\s*(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?")
+AUTHOR_CONJUNCTION_PATTERN = re.compile(r"\s+(?:and|&)\s+", re.IGNORECASE)
+BYLINE_PREFIX_PATTERN = re.compile(r"^\s*by\s+", re.IGNORECASE)
 ORG_HINTS = {
     "academy",
     "agency",
@@ -117,7 +125,7 @@ class ExtractionPayload(BaseModel):
 
 
 def _clean(value: Any) -> str:
-    return re.sub(r"\s+", " ", str(value or "")).strip()
+    return WHITESPACE_PATTERN.sub(" ", str(value or "")).strip()
 
 
 def _clean_lower(value: Any) -> str:
@@ -160,8 +168,8 @@ def _normalize_doi(value: Any) -> str:
     match = DOI_PATTERN.search(text)
     if match:
         text = match.group(0)
-    normalized = re.sub(r"^https?://(?:dx\.)?doi\.org/", "", text, flags=re.IGNORECASE)
-    normalized = re.sub(r"^doi:\s*", "", normalized, flags=re.IGNORECASE)
+    normalized = DOI_URL_PREFIX_PATTERN.sub("", text)
+    normalized = DOI_LABEL_PREFIX_PATTERN.sub("", normalized)
     normalized = normalized.strip().rstrip(".;,)")
     return normalized.lower()
 
@@ -170,14 +178,14 @@ def _normalize_isbn(value: Any) -> str:
     text = _clean(value)
     if not text:
         return ""
-    return re.sub(r"[^0-9Xx]", "", text).upper()
+    return NON_ISBN_CHAR_PATTERN.sub("", text).upper()
 
 
 def _normalize_issn(value: Any) -> str:
     text = _clean(value)
     if not text:
         return ""
-    digits = re.sub(r"[^0-9Xx]", "", text).upper()
+    digits = NON_ISBN_CHAR_PATTERN.sub("", text).upper()
     if len(digits) == 8:
         return f"{digits[:4]}-{digits[4:]}"
     return digits
@@ -208,7 +216,7 @@ def _parse_year(value: str) -> str:
     text = _clean(value)
     if not text:
         return "n.d."
-    match = re.search(r"(19|20)\d{2}", text)
+    match = YEAR_PATTERN.search(text)
     return match.group(0) if match else "n.d."
 
 
@@ -428,7 +436,7 @@ def _parse_date_parts(value: Any) -> dict[str, Any]:
         return {}
     parsed: datetime | None = None
     normalized = text
-    iso_match = re.match(r"^\s*(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?", text)
+    iso_match = ISO_DATE_PREFIX_PATTERN.match(text)
     if iso_match:
         year = int(iso_match.group(1))
         month = int(iso_match.group(2)) if iso_match.group(2) else None
@@ -493,13 +501,13 @@ def _split_author_string(value: Any) -> list[str]:
     if PERSON_AUTHOR_DELIMITERS.search(text):
         return [part for part in PERSON_AUTHOR_DELIMITERS.split(text) if _clean(part)]
     if " and " in text.lower() and "," not in text and not _is_probable_organization(text):
-        return [_clean(part) for part in re.split(r"\s+(?:and|&)\s+", text, flags=re.IGNORECASE) if _clean(part)]
+        return [_clean(part) for part in AUTHOR_CONJUNCTION_PATTERN.split(text) if _clean(part)]
     return [text]
 
 
 def _normalize_author_candidate_value(value: Any) -> str:
     normalized = _clean(value)
-    normalized = re.sub(r"^\s*by\s+", "", normalized, flags=re.IGNORECASE)
+    normalized = BYLINE_PREFIX_PATTERN.sub("", normalized)
     return normalized.strip(" \t,;:-")
 
 
@@ -527,7 +535,7 @@ def _is_junk_date_candidate(value: str) -> bool:
     if not any(character.isdigit() for character in normalized):
         return True
     parsed = _parse_date_parts(value)
-    return parsed.get("year", "__missing__") is None and not re.search(r"(19|20)\d{2}", normalized)
+    return parsed.get("year", "__missing__") is None and not YEAR_PATTERN.search(normalized)
 
 
 def _parse_author_object(raw: Any) -> dict[str, Any] | None:
@@ -807,12 +815,14 @@ def compute_citation_version(context: dict[str, Any]) -> str:
 
 def normalize_citation_payload(payload: ExtractionPayload) -> dict[str, Any]:
     raw = dict(payload.raw_metadata or {})
-    logger.info(
-        "citation.normalize.start",
-        extra={"stage": "normalization_input", **_summarize_extraction_payload(payload)},
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "citation.normalize.start",
+            extra={"stage": "normalization_input", **_summarize_extraction_payload(payload)},
+        )
     page_url = _normalize_page_url(payload.page_url or raw.get("page_url") or "")
     canonical_url = _canonical_url(payload.canonical_url or raw.get("canonical_url") or page_url)
+    hostname = _domain(canonical_url or page_url)
     identifiers = _normalize_identifiers(payload, raw)
     title = _candidate_value_ranked(
         payload.title_candidates,
@@ -827,7 +837,7 @@ def normalize_citation_payload(payload: ExtractionPayload) -> dict[str, Any]:
     site_name = _normalize_org_name(
         _candidate_value_ranked(
             payload.publisher_candidates,
-            fallback=raw.get("siteName") or raw.get("site_name") or _domain(canonical_url or page_url),
+            fallback=raw.get("siteName") or raw.get("site_name") or hostname,
             priority_fn=_publisher_source_priority,
         )
     )
@@ -893,7 +903,7 @@ def normalize_citation_payload(payload: ExtractionPayload) -> dict[str, Any]:
         "page_url": page_url or canonical_url or None,
         "language": _clean(raw.get("language") or raw.get("inLanguage") or ""),
         "description": _clean(raw.get("description")),
-        "hostname": _domain(canonical_url or page_url),
+        "hostname": hostname,
     }
     for field in ("volume", "issue", "first_page", "last_page", "pages"):
         value = _clean(raw.get(field) or raw.get(field.replace("_", "")))
@@ -945,16 +955,17 @@ def normalize_citation_payload(payload: ExtractionPayload) -> dict[str, Any]:
     }
     context["citation_version"] = compute_citation_version(context)
 
-    logger.info(
-        "citation.normalize.selected",
-        extra={
-            "stage": "normalization_output",
-            **_summarize_normalized_source(source),
-            "context_locator_keys": sorted(str(key) for key in context["locator"].keys()),
-            "quote_length": len(context["quote"]),
-            "excerpt_length": len(context["excerpt"]),
-        },
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "citation.normalize.selected",
+            extra={
+                "stage": "normalization_output",
+                **_summarize_normalized_source(source),
+                "context_locator_keys": sorted(str(key) for key in context["locator"].keys()),
+                "quote_length": len(context["quote"]),
+                "excerpt_length": len(context["excerpt"]),
+            },
+        )
 
     return {
         "source": source,
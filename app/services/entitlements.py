@@ -13,6 +13,8 @@ LEGACY_TIER_MAP = {
     "premium": STANDARD_TIER,
 }
 
+PAID_TIERS = frozenset({STANDARD_TIER, PRO_TIER, DEV_TIER})
+
 
 @dataclass(frozen=True)
 class TierCapabilities:
@@ -108,8 +110,7 @@ def get_tier_capabilities(account_type: Optional[str]) -> TierCapabilities:
 
 
 def can_use_cloudscraper(account_type: Optional[str]) -> bool:
-    tier = normalize_account_type(account_type)
-    return tier in {STANDARD_TIER, PRO_TIER, DEV_TIER}
+    return normalize_account_type(account_type) in PAID_TIERS
 
 
 def has_daily_limit(account_type: Optional[str]) -> bool:
@@ -117,13 +118,11 @@ def has_daily_limit(account_type: Optional[str]) -> bool:
 
 
 def can_use_bookmarks(account_type: Optional[str]) -> bool:
-    tier = normalize_account_type(account_type)
-    return tier in {STANDARD_TIER, PRO_TIER, DEV_TIER}
+    return normalize_account_type(account_type) in PAID_TIERS
 
 
 def can_use_history_search(account_type: Optional[str]) -> bool:
-    tier = normalize_account_type(account_type)
-    return tier in {STANDARD_TIER, PRO_TIER, DEV_TIER}
+    return normalize_account_type(account_type) in PAID_TIERS
 
 
 def should_show_ads(account_type: Optional[str]) -> bool:
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from collections import defaultdict, deque
+from functools import lru_cache
 from threading import Lock
-from time import perf_counter
-from typing import Callable
+from time import perf_counter_ns
+from typing import Callable, Iterable
 
 
 GaugeCallback = Callable[[], float]
@@ -30,12 +31,7 @@ class MetricsStore:
     def percentile_ms(self, name: str, percentile: float) -> float:
         with self._lock:
             samples = list(self._latency_samples.get(name, ()))
-        if not samples:
-            return 0.0
-        samples.sort()
-        idx = int(round((percentile / 100) * (len(samples) - 1)))
-        idx = max(0, min(idx, len(samples) - 1))
-        return float(samples[idx])
+        return _percentiles(samples, (percentile,))[0]
 
     def counter(self, name: str) -> int:
         with self._lock:
@@ -58,15 +54,12 @@ class MetricsStore:
             if not samples:
                 continue
             metric = _to_prom_metric_name(key)
-            sorted_samples = sorted(samples)
-            p50 = _percentile_from_sorted(sorted_samples, 50)
-            p95 = _percentile_from_sorted(sorted_samples, 95)
-            p99 = _percentile_from_sorted(sorted_samples, 99)
+            p50, p95, p99 = _percentiles(samples, (50, 95, 99))
             lines.append(f"# TYPE {metric}_milliseconds summary")
             lines.append(f'{metric}_milliseconds{{quantile="0.50"}} {p50:.3f}')
             lines.append(f'{metric}_milliseconds{{quantile="0.95"}} {p95:.3f}')
             lines.append(f'{metric}_milliseconds{{quantile="0.99"}} {p99:.3f}')
-            lines.append(f"{metric}_milliseconds_count {len(sorted_samples)}")
+            lines.append(f"{metric}_milliseconds_count {len(samples)}")
 
         for key in sorted(gauges):
             metric = _to_prom_metric_name(key)
@@ -101,42 +94,48 @@ def _percentile_from_sorted(samples: list[float], percentile: float) -> float:
     return float(samples[idx])
 
 
+def _percentiles(samples: list[float], percentiles: Iterable[float]) -> tuple[float, ...]:
+    ordered = sorted(samples)
+    return tuple(_percentile_from_sorted(ordered, percentile) for percentile in percentiles)
+
+
 metrics = MetricsStore()
 
 
+@lru_cache(maxsize=64)
+def _dependency_metric_names(dependency: str) -> tuple[str, str]:
+    return f"dependency.{dependency}.failure_count", f"dependency.{dependency}.latency"
+
+
 def record_dependency_call(dependency: str, call: Callable[[], object]) -> object:
-    start = perf_counter()
+    failure_name, latency_name = _dependency_metric_names(dependency)
+    start = perf_counter_ns()
     try:
         result = call()
     except Exception:
-        metrics.inc(f"dependency.{dependency}.failure_count")
+        metrics.inc(failure_name)
         raise
     finally:
-        metrics.observe_ms(
-            f"dependency.{dependency}.latency",
-            (perf_counter() - start) * 1000,
-        )
+        metrics.observe_ms(latency_name, (perf_counter_ns() - start) / 1_000_000)
 
     status_code = getattr(result, "status_code", None)
     if isinstance(status_code, int) and status_code >= 400:
-        metrics.inc(f"dependency.{dependency}.failure_count")
+        metrics.inc(failure_name)
     return result
 
 
 async def record_dependency_call_async(dependency: str, call: Callable[[], object]) -> object:
-    start = perf_counter()
+    failure_name, latency_name = _dependency_metric_names(dependency)
+    start = perf_counter_ns()
     try:
         result = await call()
     except Exception:
-        metrics.inc(f"dependency.{dependency}.failure_count")
+        metrics.inc(failure_name)
         raise
     finally:
-        metrics.observe_ms(
-            f"dependency.{dependency}.latency",
-            (perf_counter() - start) * 1000,
-        )
+        metrics.observe_ms(latency_name, (perf_counter_ns() - start) / 1_000_000)
 
     status_code = getattr(result, "status_code", None)
     if isinstance(status_code, int) and status_code >= 400:
-        metrics.inc(f"dependency.{dependency}.failure_count")
+        metrics.inc(failure_name)
     return result
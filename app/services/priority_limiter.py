@@ -26,7 +26,13 @@ class PriorityLimiter:
             future: asyncio.Future[bool] = loop.create_future()
             heapq.heappush(self._waiters, (priority, next(self._order), future))
         wait_start = asyncio.get_running_loop().time()
-        await future
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as this waiter was cancelled; give it back.
+                await self.release()
+            raise
         return max(0.0, (asyncio.get_running_loop().time() - wait_start) * 1000)
 
     async def release(self) -> None:
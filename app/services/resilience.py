@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import random
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Awaitable, Callable, Iterable, TypeVar
 
 import httpx
@@ -10,6 +12,8 @@ import httpx
 T = TypeVar("T")
 
 DEFAULT_TIMEOUT = httpx.Timeout(connect=3.0, read=6.0, write=3.0, pool=6.0)
+# Private generator so retry jitter neither consumes nor depends on the global random state.
+_JITTER_RNG = random.Random()
 
 
 @dataclass(frozen=True)
@@ -20,12 +24,45 @@ class RetryPolicy:
     jitter_s: float = 0.2
 
 
-TRANSIENT_HTTP_STATUS = {408, 425, 429, 500, 502, 503, 504}
+TRANSIENT_HTTP_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Gateway/unavailable statuses signal an upstream outage; a plain 500 is usually an
+# application error on one route (e.g. a failing PostgREST RPC) and should not trip the breaker.
+OUTAGE_HTTP_STATUS = frozenset({502, 503, 504})
+
+
+@lru_cache(maxsize=32)
+def _backoff_schedule(policy: RetryPolicy) -> tuple[float, ...]:
+    return tuple(
+        min(policy.max_delay_s, policy.base_delay_s * (2 ** (attempt - 1)))
+        for attempt in range(1, max(policy.max_attempts, 1) + 1)
+    )
 
 
 def _compute_backoff(attempt: int, policy: RetryPolicy) -> float:
-    delay = min(policy.max_delay_s, policy.base_delay_s * (2 ** (attempt - 1)))
-    return max(0.0, delay + random.uniform(0.0, policy.jitter_s))
+    schedule = _backoff_schedule(policy)
+    delay = schedule[min(attempt, len(schedule)) - 1]
+    return max(0.0, delay + _JITTER_RNG.random() * policy.jitter_s)
+
+
+class CircuitBreaker:
+    def __init__(self, *, failure_threshold: int = 3, cooldown_s: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown_s = cooldown_s
+        self._state: dict[str, tuple[int, float]] = {}
+
+    def is_open(self, key: str) -> bool:
+        _failures, open_until = self._state.get(key, (0, 0.0))
+        return open_until > time.monotonic()
+
+    def record_success(self, key: str) -> None:
+        self._state.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        failures, open_until = self._state.get(key, (0, 0.0))
+        failures += 1
+        if failures >= self.failure_threshold:
+            open_until = time.monotonic() + self.cooldown_s
+        self._state[key] = (failures, open_until)
 
 
 async def call_with_retries(
@@ -36,7 +73,8 @@ async def call_with_retries(
     retry_statuses: Iterable[int] = TRANSIENT_HTTP_STATUS,
 ) -> T:
     last_exc: BaseException | None = None
-    retry_statuses = set(retry_statuses)
+    if not isinstance(retry_statuses, (set, frozenset)):
+        retry_statuses = frozenset(retry_statuses)
 
     for attempt in range(1, retry_policy.max_attempts + 1):
         try:
@@ -13,6 +13,13 @@ class SupabaseRestRepository:
     def __init__(self, *, base_url: str | None, service_role_key: str | None):
         self.base_url = (base_url or "").rstrip("/")
         self.service_role_key = service_role_key
+        self._auth_headers: dict[str, str] = {}
+        if service_role_key:
+            self._auth_headers = {
+                "apikey": service_role_key,
+                "Authorization": f"Bearer {service_role_key}",
+            }
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
 
     def _resource_url(self, resource: str) -> str:
         if not self.base_url:
@@ -24,12 +31,7 @@ class SupabaseRestRepository:
         if not self.service_role_key:
             raise HTTPException(status_code=500, detail="Supabase service role key missing.")
 
-        headers = {
-            "apikey": self.service_role_key,
-            "Authorization": f"Bearer {self.service_role_key}",
-        }
-        if include_content_type:
-            headers["Content-Type"] = "application/json"
+        headers = (self._json_headers if include_content_type else self._auth_headers).copy()
         if prefer:
             headers["Prefer"] = prefer
         return headers
@@ -133,6 +135,6 @@ def response_error_code(response) -> str:
 
 
 async def expect_ok(response, *, detail: str, allowed: set[int] | tuple[int, ...] = (200,)):
-    if response.status_code not in set(allowed):
+    if response.status_code not in allowed:
         raise HTTPException(status_code=500, detail=detail)
     return response
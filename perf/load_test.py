@@ -3,16 +3,23 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import itertools
 import json
+import multiprocessing
 import random
+import re
 import statistics
 import time
-from dataclasses import dataclass
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+GAUGE_LINE_PATTERN = re.compile(r"^(\w+)\s+([-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*$", re.MULTILINE)
+
 
 @dataclass
 class Result:
@@ -22,28 +29,27 @@ class Result:
     error: str | None = None
 
 
-def _percentile(values: list[float], p: float) -> float:
-    if not values:
+def _percentile(ordered: list[float], p: float) -> float:
+    if not ordered:
         return 0.0
-    ordered = sorted(values)
     idx = int(round((p / 100.0) * (len(ordered) - 1)))
     idx = max(0, min(idx, len(ordered) - 1))
     return float(ordered[idx])
 
 
-def _pick_weighted(endpoints: list[dict[str, Any]]) -> dict[str, Any]:
-    choices = [max(1, int(ep.get("weight", 1))) for ep in endpoints]
-    return random.choices(endpoints, weights=choices, k=1)[0]
+def _cumulative_weights(endpoints: list[dict[str, Any]]) -> list[int]:
+    return list(itertools.accumulate(max(1, int(ep.get("weight", 1))) for ep in endpoints))
+
+
+def _pick_weighted(endpoints: list[dict[str, Any]], cum_weights: list[int], rng: random.Random) -> dict[str, Any]:
+    return rng.choices(endpoints, cum_weights=cum_weights, k=1)[0]
 
 
-def _extract_gauge(metrics_text: str, metric_name: str) -> float:
-    for line in metrics_text.splitlines():
-        if line.startswith(f"{metric_name} "):
-            try:
-                return float(line.split(" ", 1)[1].strip())
-            except ValueError:
-                return 0.0
-    return 0.0
+def _parse_gauges(metrics_text: str) -> dict[str, float]:
+    gauges: dict[str, float] = {}
+    for match in GAUGE_LINE_PATTERN.finditer(metrics_text):
+        gauges.setdefault(match.group(1), float(match.group(2)))
+    return gauges
 
 
 async def _run_user(
@@ -59,9 +65,13 @@ async def _run_user(
     ramp_seconds = max(0.0, float(profile.get("ramp_seconds", 0)))
     vus = max(1, int(profile.get("virtual_users", 1)))
     await asyncio.sleep((user_idx / vus) * ramp_seconds)
+    # Seed per VU so runs replay the same request mix without sharing the global RNG.
+    rng = random.Random(user_idx)
+    endpoints = profile["endpoints"]
+    cum_weights = _cumulative_weights(endpoints)
 
     while time.perf_counter() < end_at:
-        ep = _pick_weighted(profile["endpoints"])
+        ep = _pick_weighted(endpoints, cum_weights, rng)
         method = ep.get("method", "GET").upper()
         path = ep["path"]
         headers = dict(ep.get("headers", {}))
@@ -85,11 +95,15 @@ async def _run_user(
         # lightweight think time to avoid lockstep request storms
         elapsed = time.perf_counter() - started
         _ = elapsed  # preserve for future profile tuning
-        await asyncio.sleep(random.uniform(0.01, 0.2))
+        await asyncio.sleep(rng.uniform(0.01, 0.2))
 
 
-async def run_profile(base_url: str, profile: dict[str, Any], duration_override: int | None) -> dict[str, Any]:
-    duration_seconds = int(duration_override or profile.get("duration_seconds", 60))
+async def _run_users(
+    base_url: str,
+    profile: dict[str, Any],
+    duration_seconds: int,
+    user_indices: list[int],
+) -> tuple[list[Result], float]:
     timeout_seconds = float(profile.get("request_timeout_seconds", 20))
     started = time.perf_counter()
     end_at = started + duration_seconds
@@ -111,18 +125,71 @@ async def run_profile(base_url: str, profile: dict[str, Any], duration_override:
                     results=results,
                 )
             )
-            for i in range(max(1, int(profile.get("virtual_users", 1))))
+            for i in user_indices
         ]
         await asyncio.gather(*workers)
+    return results, time.perf_counter() - started
+
+
+def _run_users_in_process(
+    base_url: str,
+    profile: dict[str, Any],
+    duration_seconds: int,
+    user_indices: list[int],
+) -> tuple[list[tuple[bool, int, float, str | None]], float]:
+    # Each worker owns its event loop and client; only plain tuples cross the process boundary.
+    results, wall_seconds = asyncio.run(_run_users(base_url, profile, duration_seconds, user_indices))
+    return [astuple(r) for r in results], wall_seconds
+
+
+async def _run_users_across_processes(
+    base_url: str,
+    profile: dict[str, Any],
+    duration_seconds: int,
+    vus: int,
+    processes: int,
+) -> tuple[list[Result], float]:
+    shards = [list(range(vus))[i::processes] for i in range(min(processes, vus))]
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")) as pool:
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _run_users_in_process, base_url, profile, duration_seconds, shard)
+                for shard in shards
+            )
+        )
+    # Throughput is measured from each shard's own clock so pool spawn and interpreter
+    # start-up are not charged to the run.
+    results = [Result(*row) for rows, _wall_seconds in batches for row in rows]
+    return results, max(wall_seconds for _rows, wall_seconds in batches)
+
+
+async def run_profile(
+    base_url: str,
+    profile: dict[str, Any],
+    duration_override: int | None,
+    processes: int = 1,
+) -> dict[str, Any]:
+    duration_seconds = int(duration_override or profile.get("duration_seconds", 60))
+    timeout_seconds = float(profile.get("request_timeout_seconds", 20))
+    vus = max(1, int(profile.get("virtual_users", 1)))
+
+    if processes > 1:
+        results, wall_seconds = await _run_users_across_processes(base_url, profile, duration_seconds, vus, processes)
+    else:
+        results, wall_seconds = await _run_users(base_url, profile, duration_seconds, list(range(vus)))
+
+    async with httpx.AsyncClient(timeout=httpx.Timeout(timeout_seconds), verify=False) as client:
         metrics_resp = await client.get(f"{base_url}/metrics")
         metrics_text = metrics_resp.text if metrics_resp.status_code == 200 else ""
 
-    elapsed = max(1e-6, time.perf_counter() - started)
-    latencies = [r.latency_ms for r in results]
+    elapsed = max(1e-6, wall_seconds)
+    latencies = sorted(r.latency_ms for r in results)
     errors = [r for r in results if not r.ok]
-    queue_depth = _extract_gauge(metrics_text, "unlock_pipeline_queue_depth")
-    in_flight = _extract_gauge(metrics_text, "unlock_pipeline_in_flight")
-    rss_mb = _extract_gauge(metrics_text, "process_memory_rss_mb")
+    gauges = _parse_gauges(metrics_text)
+    queue_depth = gauges.get("unlock_pipeline_queue_depth", 0.0)
+    in_flight = gauges.get("unlock_pipeline_in_flight", 0.0)
+    rss_mb = gauges.get("process_memory_rss_mb", 0.0)
 
     return {
         "profile": profile["name"],
@@ -143,11 +210,8 @@ async def run_profile(base_url: str, profile: dict[str, Any], duration_override:
 
 
 def _status_breakdown(results: list[Result]) -> dict[str, int]:
-    counts: dict[str, int] = {}
-    for r in results:
-        key = str(r.status_code)
-        counts[key] = counts.get(key, 0) + 1
-    return dict(sorted(counts.items(), key=lambda item: int(item[0])))
+    counts = Counter(r.status_code for r in results)
+    return {str(code): counts[code] for code in sorted(counts)}
 
 
 def parse_args() -> argparse.Namespace:
@@ -156,6 +220,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--profile", action="append", required=True, help="Path to profile JSON; can be repeated")
     parser.add_argument("--duration-override", type=int, default=None, help="Override profile duration seconds")
     parser.add_argument("--output", default="perf/results/latest-results.json")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Split virtual users across this many worker processes, each with its own event loop",
+    )
     return parser.parse_args()
 
 
@@ -166,7 +236,7 @@ def main() -> None:
 
     all_results: list[dict[str, Any]] = []
     for profile in profiles:
-        result = asyncio.run(run_profile(base_url, profile, args.duration_override))
+        result = asyncio.run(run_profile(base_url, profile, args.duration_override, args.processes))
         all_results.append(result)
         print(json.dumps(result, indent=2))
 
@@ -21,20 +21,10 @@ if "supabase" not in sys.modules:
             self.data = data if data is not None else []
 
     class _DummyTable:
-        def select(self, *args, **kwargs):
+        def _chain(self, *args, **kwargs):
             return self
 
-        def limit(self, *args, **kwargs):
-            return self
-
-        def eq(self, *args, **kwargs):
-            return self
-
-        def single(self, *args, **kwargs):
-            return self
-
-        def insert(self, *args, **kwargs):
-            return self
+        select = limit = eq = single = insert = _chain
 
         def execute(self):
             return _DummyExecuteResult(data=[])
@@ -76,6 +66,46 @@ if "supabase" not in sys.modules:
     sys.modules["supabase.client"] = supabase_client_stub
 
 
+_ANONYMOUS_SUPABASE_CLIENT = types.SimpleNamespace(
+    auth=types.SimpleNamespace(get_user=lambda _token: types.SimpleNamespace(user=None))
+)
+
+
+def anonymous_supabase_client(_url, _key):
+    return _ANONYMOUS_SUPABASE_CLIENT
+
+
+def use_supabase_client(monkeypatch, create_client):
+    # Patch in place rather than reloading app.core.auth/config so every router keeps
+    # pointing at the same module objects (and caches) for the whole session.
+    import supabase
+
+    import app.core.auth as core_auth
+    import app.core.config as core_config
+
+    monkeypatch.setattr(supabase, "create_client", create_client)
+    monkeypatch.setattr(core_auth, "create_client", create_client)
+    core_config.get_settings.cache_clear()
+    core_auth.get_token_verifier.cache_clear()
+
+
+def build_test_app(monkeypatch, create_client):
+    from app import main
+
+    use_supabase_client(monkeypatch, create_client)
+    return main.create_app()
+
+
+def create_app_with_routers(monkeypatch, **routers):
+    # app.main binds router objects at import, so swap in freshly reloaded route modules'
+    # routers and build a new app instead of reloading app.main itself.
+    from app import main
+
+    for name, router in routers.items():
+        monkeypatch.setattr(main, name, router)
+    return main.create_app()
+
+
 @asynccontextmanager
 async def async_test_client(app, **client_kwargs):
     transport = httpx.ASGITransport(app=app)
@@ -39,3 +39,17 @@ def test_lifespan_preserves_preconfigured_state_doubles():
             assert app.state.http_session is original[4]
 
     asyncio.run(run())
+
+
+def test_lifespan_shutdown_leaves_shared_http_client_open():
+    from app.routes.http import http_client
+
+    async def run():
+        async with lifespan(FastAPI()):
+            pass
+
+    asyncio.run(run())
+
+    # Every app built by create_app() and the billing/Supabase services share this
+    # process-wide client, so one app shutting down must not close it for the rest.
+    assert http_client.is_closed is False
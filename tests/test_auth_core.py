@@ -1,12 +1,12 @@
-import importlib
+import asyncio
 from types import SimpleNamespace
 
 import pytest
-import supabase
 
+import app.core.auth as core_auth
 from app.core.auth import RequestAuthContext
 from app.core.entitlements import derive_capability_state
-from tests.conftest import async_test_client
+from tests.conftest import async_test_client, build_test_app
 
 
 class DummyUser:
@@ -19,12 +19,12 @@ class DummyUser:
 
 class ValidAuth:
     def get_user(self, token):
-        return type("DummyResponse", (), {"user": DummyUser("user-1")})
+        return SimpleNamespace(user=DummyUser("user-1"))
 
 
 class InvalidAuth:
     def get_user(self, token):
-        return type("DummyResponse", (), {"user": None})
+        return SimpleNamespace(user=None)
 
 
 class ExpiredAuth:
@@ -78,33 +78,25 @@ class FakeIdentityRepository:
         return True
 
 
-def _load_main(monkeypatch, *, auth_impl, identity_repo=None):
+def _build_app(monkeypatch, *, auth_impl, identity_repo=None):
     monkeypatch.setenv("SUPABASE_URL", "http://example.com")
     monkeypatch.setenv("SUPABASE_KEY", "anon")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
 
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient(auth_impl))
+    app = build_test_app(monkeypatch, lambda url, key: DummyClient(auth_impl))
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
     from app.modules.identity import routes as identity_routes
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
     identity_routes.service.repository = identity_repo or FakeIdentityRepository()
-    return main
+    return app
 
 
 @pytest.mark.anyio
 async def test_protected_route_rejects_missing_bearer(monkeypatch):
-    main = _load_main(monkeypatch, auth_impl=ValidAuth())
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch, auth_impl=ValidAuth())
+    async with async_test_client(app) as client:
         response = await client.get("/api/me")
         projects_response = await client.get("/api/projects")
 
@@ -116,8 +108,8 @@ async def test_protected_route_rejects_missing_bearer(monkeypatch):
 
 @pytest.mark.anyio
 async def test_protected_route_rejects_invalid_and_cookie_only_auth(monkeypatch):
-    main = _load_main(monkeypatch, auth_impl=InvalidAuth())
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch, auth_impl=InvalidAuth())
+    async with async_test_client(app) as client:
         invalid = await client.get("/api/me", headers={"Authorization": "Bearer invalid-token"})
         cookie_only = await client.get("/api/me", headers={"Cookie": "legacy_session=legacy"})
 
@@ -129,8 +121,8 @@ async def test_protected_route_rejects_invalid_and_cookie_only_auth(monkeypatch)
 
 @pytest.mark.anyio
 async def test_protected_route_rejects_expired_token(monkeypatch):
-    main = _load_main(monkeypatch, auth_impl=ExpiredAuth())
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch, auth_impl=ExpiredAuth())
+    async with async_test_client(app) as client:
         response = await client.get("/api/me", headers={"Authorization": "Bearer expired-token"})
 
     assert response.status_code == 401
@@ -139,9 +131,9 @@ async def test_protected_route_rejects_expired_token(monkeypatch):
 
 @pytest.mark.anyio
 async def test_me_and_entitlements_return_canonical_envelopes(monkeypatch):
-    main = _load_main(monkeypatch, auth_impl=ValidAuth())
+    app = _build_app(monkeypatch, auth_impl=ValidAuth())
     headers = {"Authorization": "Bearer valid-token"}
-    async with async_test_client(main.app) as client:
+    async with async_test_client(app) as client:
         me_response = await client.get("/api/me", headers=headers)
         entitlement_response = await client.get("/api/entitlements/current", headers=headers)
         session_response = await client.post("/api/auth/session", json={"access_token": "valid-token"})
@@ -181,3 +173,32 @@ def test_request_auth_context_contract():
     assert hasattr(auth_context, "token_claims")
     assert hasattr(auth_context, "account_state")
     assert hasattr(auth_context, "capability_state")
+
+
+@pytest.mark.anyio
+async def test_concurrent_verifications_of_same_token_share_one_lookup(monkeypatch):
+    class CountingVerifier:
+        def __init__(self):
+            self.calls = 0
+
+        def verify(self, token):
+            self.calls += 1
+            return RequestAuthContext(
+                authenticated=True,
+                user_id="user-1",
+                supabase_subject="user-1",
+                email=None,
+                access_token=token,
+                token_claims={},
+            )
+
+    verifier = CountingVerifier()
+    monkeypatch.setattr(core_auth, "get_token_verifier", lambda: verifier)
+
+    contexts = await asyncio.gather(*(core_auth.verify_access_token("shared-token") for _ in range(5)))
+    assert verifier.calls == 1
+    assert {context.access_token for context in contexts} == {"shared-token"}
+    assert core_auth._inflight_verifications == {}
+
+    await core_auth.verify_access_token("shared-token")
+    assert verifier.calls == 2
@@ -1,11 +1,11 @@
 import asyncio
-import importlib
 from types import SimpleNamespace
 
 import pytest
-import supabase
 
 from app.core.auth import RequestAuthContext
+from app.modules.identity.schemas import SignupRequest
+from tests.conftest import use_supabase_client
 
 
 class DummySupabaseAuth:
@@ -100,22 +100,18 @@ def _load_identity(monkeypatch, repository):
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummySupabaseClient())
+    use_supabase_client(monkeypatch, lambda url, key: DummySupabaseClient())
 
-    import app.core.config as core_config
     from app.modules.identity import routes as identity_routes
-    from app.modules.identity.schemas import SignupRequest
 
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
     identity_routes.service.repository = repository
     identity_routes.service._supabase_admin = DummySupabaseClient()
-    return identity_routes, SignupRequest
+    return identity_routes
 
 
 @pytest.mark.anyio
 async def test_signup_bootstraps_all_canonical_account_rows(monkeypatch):
-    identity_routes, SignupRequest = _load_identity(monkeypatch, FakeBootstrapRepository())
+    identity_routes = _load_identity(monkeypatch, FakeBootstrapRepository())
 
     payload = SignupRequest(
         email="ada@example.com",
@@ -137,7 +133,7 @@ async def test_signup_bootstraps_all_canonical_account_rows(monkeypatch):
 
 @pytest.mark.anyio
 async def test_repeat_bootstrap_is_idempotent(monkeypatch):
-    identity_routes, _ = _load_identity(monkeypatch, FakeBootstrapRepository())
+    identity_routes = _load_identity(monkeypatch, FakeBootstrapRepository())
     auth_context = RequestAuthContext(
         authenticated=True,
         user_id="user-1",
@@ -160,7 +156,7 @@ async def test_repeat_bootstrap_is_idempotent(monkeypatch):
 
 @pytest.mark.anyio
 async def test_incomplete_bootstrap_fails_after_recovery_attempt(monkeypatch):
-    identity_routes, _ = _load_identity(monkeypatch, FakeBootstrapFailureRepository())
+    identity_routes = _load_identity(monkeypatch, FakeBootstrapFailureRepository())
     auth_context = RequestAuthContext(
         authenticated=True,
         user_id="user-1",
@@ -178,7 +174,7 @@ async def test_incomplete_bootstrap_fails_after_recovery_attempt(monkeypatch):
 
 @pytest.mark.anyio
 async def test_concurrent_bootstrap_calls_converge_to_single_account_state(monkeypatch):
-    identity_routes, _ = _load_identity(monkeypatch, FakeBootstrapRepository())
+    identity_routes = _load_identity(monkeypatch, FakeBootstrapRepository())
     auth_context = RequestAuthContext(
         authenticated=True,
         user_id="user-1",
@@ -3,27 +3,21 @@ import hmac
 import importlib
 import json
 from contextlib import asynccontextmanager
+from types import SimpleNamespace
 
 import httpx
 import pytest
-import supabase
 
-from tests.conftest import async_test_client
+from tests.conftest import async_test_client, create_app_with_routers, use_supabase_client
+from tests.test_auth_core import DummyUser
 
 
-class DummyUser:
-    def __init__(self, user_id: str, email: str = "user@example.com"):
-        self.id = user_id
-        self.email = email
-        self.aud = "authenticated"
-        self.role = "authenticated"
+TOKEN_USERS = {"valid-token": DummyUser("user-1", "user@example.com")}
 
 
 class DummyAuth:
     def get_user(self, token):
-        if token == "valid-token":
-            return type("DummyResponse", (), {"user": DummyUser("user-1", "user@example.com")})()
-        return type("DummyResponse", (), {"user": None})()
+        return SimpleNamespace(user=TOKEN_USERS.get(token))
 
 
 class DummyClient:
@@ -224,23 +218,16 @@ def _load_app(monkeypatch, *, state: SharedBillingState | None = None, paddle_cl
     monkeypatch.setenv("PADDLE_PRO_YEARLY_PRICE_ID", "price_pro_yearly")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient())
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
     import app.modules.billing.service as billing_service
     import app.modules.billing.routes as billing_routes
     import app.modules.identity.routes as identity_routes
-    from app import main
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
     billing_service = importlib.reload(billing_service)
     billing_routes = importlib.reload(billing_routes)
     identity_routes = importlib.reload(identity_routes)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, billing_router=billing_routes.router, identity_router=identity_routes.router)
 
     shared_state = state or SharedBillingState()
     shared_repo = SharedRepository(shared_state)
@@ -250,7 +237,7 @@ def _load_app(monkeypatch, *, state: SharedBillingState | None = None, paddle_cl
     if paddle_client is not None:
         monkeypatch.setattr(billing_service, "http_client", paddle_client)
 
-    return main.app, shared_state, paddle_client
+    return app, shared_state, paddle_client
 
 
 def _signature(secret: str, payload: dict[str, object], timestamp: str = "1700000000") -> str:
@@ -360,27 +347,20 @@ async def test_checkout_can_switch_to_sandbox_via_environment_variable(monkeypat
     monkeypatch.setenv("PADDLE_PRO_YEARLY_PRICE_ID", "price_pro_yearly")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient())
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
     import app.modules.billing.routes as billing_routes
     import app.modules.billing.service as billing_service
-    from app import main
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
     billing_service = importlib.reload(billing_service)
     billing_routes = importlib.reload(billing_routes)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, billing_router=billing_routes.router)
     billing_routes.service.repository = SharedRepository(SharedBillingState())
 
     paddle_client = FakePaddleClient()
     monkeypatch.setattr(billing_service, "http_client", paddle_client)
 
-    async with async_test_client(main.app) as client:
+    async with async_test_client(app) as client:
         response = await client.post(
             "/api/billing/checkout",
             headers={"Authorization": "Bearer valid-token"},
@@ -400,24 +380,17 @@ async def test_checkout_rejects_missing_provider_config_clearly(monkeypatch):
     monkeypatch.setenv("PADDLE_WEBHOOK_SECRET", "secret")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient())
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
     import app.modules.billing.routes as billing_routes
     import app.modules.billing.service as billing_service
-    from app import main
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
     billing_service = importlib.reload(billing_service)
     billing_routes = importlib.reload(billing_routes)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, billing_router=billing_routes.router)
     billing_routes.service.repository = SharedRepository(SharedBillingState())
 
-    async with async_test_client(main.app) as client:
+    async with async_test_client(app) as client:
         response = await client.post(
             "/api/billing/checkout",
             headers={"Authorization": "Bearer valid-token"},
@@ -443,27 +416,20 @@ async def test_checkout_rejects_paddle_environment_mismatch_clearly(monkeypatch)
     monkeypatch.setenv("PADDLE_PRO_YEARLY_PRICE_ID", "price_pro_yearly")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient())
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
     import app.modules.billing.routes as billing_routes
     import app.modules.billing.service as billing_service
-    from app import main
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
     billing_service = importlib.reload(billing_service)
     billing_routes = importlib.reload(billing_routes)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, billing_router=billing_routes.router)
     billing_routes.service.repository = SharedRepository(SharedBillingState())
 
     paddle_client = FakePaddleClient()
     monkeypatch.setattr(billing_service, "http_client", paddle_client)
 
-    async with async_test_client(main.app) as client:
+    async with async_test_client(app) as client:
         response = await client.post(
             "/api/billing/checkout",
             headers={"Authorization": "Bearer valid-token"},
@@ -1,8 +1,8 @@
-import importlib
 from pathlib import Path
 
 import pytest
-import supabase
+
+from tests.conftest import anonymous_supabase_client, build_test_app
 
 
 FORBIDDEN_CODE_PATTERNS = (
@@ -51,11 +51,6 @@ ACTIVE_RUNTIME_GLOBS = (
 )
 
 
-class DummyClient:
-    def __init__(self):
-        self.auth = type("DummyAuth", (), {"get_user": lambda self, token: type("Resp", (), {"user": None})()})()
-
-
 def _iter_paths():
     current = Path(__file__).resolve()
     seen: set[Path] = set()
@@ -118,19 +113,9 @@ async def test_only_canonical_routes_are_mounted(monkeypatch):
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
-
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
-
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
+    app = build_test_app(monkeypatch, anonymous_supabase_client)
 
-    mounted = {route.path for route in main.app.routes}
+    mounted = {route.path for route in app.routes}
 
     for forbidden in (
         "/api" + "/unlocks",
@@ -10,7 +10,7 @@ from app.modules.research.common import load_capability_state_from_request
 from app.modules.research import routes as research_routes
 from app.modules.workspace import routes as workspace_routes
 from tests.conftest import async_test_client
-from tests.test_auth_core import ValidAuth, _load_main
+from tests.test_auth_core import ValidAuth, _build_app
 
 
 def _request_scope(path: str = "/api/editor/access") -> dict[str, object]:
@@ -130,8 +130,8 @@ async def test_editor_access_response_uses_canonical_capabilities(monkeypatch):
 
 @pytest.mark.anyio
 async def test_editor_access_rejects_missing_bearer(monkeypatch):
-    main = _load_main(monkeypatch, auth_impl=ValidAuth())
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch, auth_impl=ValidAuth())
+    async with async_test_client(app) as client:
         response = await client.get("/api/editor/access")
 
     assert response.status_code == 401
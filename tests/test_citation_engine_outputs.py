@@ -68,7 +68,7 @@ def test_normalize_citation_payload_dedupes_institutional_author_and_publisher()
 
 
 def test_normalization_logs_input_and_selected_output(caplog):
-    with caplog.at_level("INFO"):
+    with caplog.at_level("DEBUG"):
         normalized = normalize_citation_payload(
             ExtractionPayload(
                 canonical_url="https://example.com/logged",
@@ -90,6 +90,13 @@ def test_normalization_logs_input_and_selected_output(caplog):
     assert selected.fingerprint == "doi:10.1000/logged"
 
 
+def test_normalization_payload_logs_stay_quiet_at_default_info_level(caplog):
+    with caplog.at_level("INFO"):
+        normalize_citation_payload(ExtractionPayload(canonical_url="https://example.com/quiet"))
+
+    assert not [record for record in caplog.records if str(record.msg).startswith("citation.normalize.")]
+
+
 def test_render_citation_separates_inline_and_full():
     source, context = _canonical_payload()
     outputs = {
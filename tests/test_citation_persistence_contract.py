@@ -347,7 +347,7 @@ async def test_create_citation_persists_and_hydrates_all_supported_render_kinds_
 async def test_replace_renders_surfaces_constraint_failures_with_upstream_detail(caplog):
     repository = CitationsRepository(supabase_repo=_FailingSupabaseRepo(), anon_key="anon")
 
-    with caplog.at_level("INFO"):
+    with caplog.at_level("DEBUG"):
         with pytest.raises(HTTPException) as exc_info:
             await repository.replace_renders(
                 citation_id="citation-1",
@@ -1,22 +1,9 @@
-import importlib
-
 import pytest
-import supabase
-
-from tests.conftest import async_test_client
-
-
-class DummyAuth:
-    def get_user(self, token):
-        return type("DummyResponse", (), {"user": None})
 
+from tests.conftest import anonymous_supabase_client, async_test_client, build_test_app
 
-class DummyClient:
-    def __init__(self):
-        self.auth = DummyAuth()
 
-
-def _load_main(monkeypatch, *, env="prod", cors_origins="https://app.writior.com,https://staging.app.writior.com"):
+def _build_app(monkeypatch, *, env="prod", cors_origins="https://app.writior.com,https://staging.app.writior.com"):
     monkeypatch.setenv("SUPABASE_URL", "http://example.com")
     monkeypatch.setenv("SUPABASE_ANON_KEY", "anon")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
@@ -24,23 +11,13 @@ def _load_main(monkeypatch, *, env="prod", cors_origins="https://app.writior.com
     monkeypatch.setenv("CORS_ORIGINS", cors_origins)
     monkeypatch.setenv("PADDLE_WEBHOOK_SECRET", "whsec_test")
 
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
-
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
-
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    return importlib.reload(main)
+    return build_test_app(monkeypatch, anonymous_supabase_client)
 
 
 @pytest.mark.anyio
 async def test_cors_preflight_allows_allowlisted_origin(monkeypatch):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         response = await client.options(
             "/api/public-config",
             headers={
@@ -55,8 +32,8 @@ async def test_cors_preflight_allows_allowlisted_origin(monkeypatch):
 
 @pytest.mark.anyio
 async def test_cors_disallows_non_allowlisted_origin(monkeypatch):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         response = await client.options(
             "/api/public-config",
             headers={
@@ -71,4 +48,4 @@ async def test_cors_disallows_non_allowlisted_origin(monkeypatch):
 
 def test_prod_rejects_wildcard_cors(monkeypatch):
     with pytest.raises(RuntimeError, match="cannot contain '\\*'"):
-        _load_main(monkeypatch, cors_origins="*")
+        _build_app(monkeypatch, cors_origins="*")
@@ -2,6 +2,7 @@ import pytest
 
 from app.core.entitlements import build_capability_state, derive_capability_state, require_capability
 from app.core.errors import CapabilityForbiddenError
+from app.services.entitlements import can_use_bookmarks, can_use_cloudscraper, can_use_history_search, should_show_ads
 
 
 def test_capability_payload_keeps_stable_keys_for_free():
@@ -48,10 +49,9 @@ def test_capability_payload_handles_grace_period_and_expired():
     assert expired.capabilities["documents"]["freeze"] is True
 
 
-def test_capability_payload_shape_is_stable():
-    tiers = ["free", "standard", "pro"]
-    statuses = ["active", "grace_period", "expired", "canceled"]
-
+@pytest.mark.parametrize("tier", ["free", "standard", "pro"])
+@pytest.mark.parametrize("status", ["active", "grace_period", "expired", "canceled"])
+def test_capability_payload_shape_is_stable(tier, status):
     expected_keys = {
         "authenticated",
         "user_id",
@@ -70,13 +70,22 @@ def test_capability_payload_shape_is_stable():
         "reports",
     }
 
-    for tier in tiers:
-        for status in statuses:
-            cap = build_capability_state(tier=tier, status=status)
-            assert expected_keys.issubset(set(cap.keys()))
-            assert capability_keys.issubset(set(cap["capabilities"].keys()))
+    cap = build_capability_state(tier=tier, status=status)
+    assert expected_keys.issubset(set(cap.keys()))
+    assert capability_keys.issubset(set(cap["capabilities"].keys()))
 
 
 def test_capability_check_denies_missing_capability():
     with pytest.raises(CapabilityForbiddenError):
         require_capability("reports", capability_state={"reports": False})
+
+
+@pytest.mark.parametrize(
+    ("account_type", "paid"),
+    [(None, False), ("free", False), ("freemium", False), ("premium", True), ("standard", True), ("Pro", True), ("dev", True)],
+)
+def test_legacy_tier_helpers_agree_on_paid_tiers(account_type, paid):
+    assert can_use_cloudscraper(account_type) is paid
+    assert can_use_bookmarks(account_type) is paid
+    assert can_use_history_search(account_type) is paid
+    assert should_show_ads(account_type) is not paid
@@ -12,6 +12,14 @@ from app.modules.extension.schemas import AuthAttemptCompleteRequest, AuthAttemp
 from app.modules.extension.service import ExtensionAccessContext, ExtensionService
 
 
+SESSION_PAYLOAD = {
+    "access_token": "access-token",
+    "refresh_token": "refresh-token",
+    "expires_in": 300,
+    "token_type": "bearer",
+}
+
+
 class AllowAllRateLimiter:
     async def hit(self, _key, *, limit, window_seconds):
         return True, max(limit - 1, 0)
@@ -282,12 +290,7 @@ async def test_handoff_exchange_rejects_missing_and_expired_codes_explicitly():
         code="expired-code",
         user_id="user-1",
         redirect_path="/editor",
-        session_payload={
-            "access_token": "access-token",
-            "refresh_token": "refresh-token",
-            "expires_in": 300,
-            "token_type": "bearer",
-        },
+        session_payload=dict(SESSION_PAYLOAD),
         expires_at="2000-01-01T00:00:00+00:00",
     )
 
@@ -305,12 +308,7 @@ async def test_handoff_exchange_rejects_bad_expiry_with_payload_error():
         code="bad-expiry-code",
         user_id="user-1",
         redirect_path="/editor",
-        session_payload={
-            "access_token": "access-token",
-            "refresh_token": "refresh-token",
-            "expires_in": 300,
-            "token_type": "bearer",
-        },
+        session_payload=dict(SESSION_PAYLOAD),
         expires_at="not-a-timestamp",
     )
 
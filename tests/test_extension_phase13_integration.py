@@ -1,29 +1,18 @@
 import importlib
+from types import SimpleNamespace
 
 import pytest
-import supabase
 
+import app.core.auth as core_auth
 from app.core.auth import RequestAuthContext
 from app.modules.extension.service import ExtensionAccessContext
-from tests.conftest import async_test_client
-
-
-class DummyUser:
-    def __init__(self, user_id: str, email: str = "user@example.com"):
-        self.id = user_id
-        self.email = email
-        self.aud = "authenticated"
-        self.role = "authenticated"
-
-
-class DummyClient:
-    def __init__(self, auth):
-        self.auth = auth
+from tests.conftest import async_test_client, create_app_with_routers, use_supabase_client
+from tests.test_auth_core import DummyClient, DummyUser
 
 
 class ValidAuth:
     def get_user(self, token):
-        return type("DummyResponse", (), {"user": DummyUser("user-1", email=f"{token}@example.com")})
+        return SimpleNamespace(user=DummyUser("user-1", email=f"{token}@example.com"))
 
 
 class ValidTokenVerifier:
@@ -44,19 +33,12 @@ def _load_app(monkeypatch):
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient(ValidAuth()))
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient(ValidAuth()))
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
     from app.modules.extension import routes as extension_routes
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
     extension_routes = importlib.reload(extension_routes)
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, extension_router=extension_routes.router)
     monkeypatch.setattr(core_auth, "get_token_verifier", lambda: ValidTokenVerifier())
     fake_access = ExtensionAccessContext(
         auth_context=RequestAuthContext(
@@ -67,22 +49,18 @@ def _load_app(monkeypatch):
             access_token="valid",
             token_claims={"sub": "user-1"},
         ),
-        account_state=type(
-            "AccountState",
-            (),
-            {
-                "profile": type("Profile", (), {"display_name": "User One"})(),
-                "entitlement": type("Entitlement", (), {"tier": "standard"})(),
-            },
-        )(),
-        capability_state=type("CapabilityState", (), {"tier": "standard", "capabilities": {"documents": {}, "exports": []}})(),
+        account_state=SimpleNamespace(
+            profile=SimpleNamespace(display_name="User One"),
+            entitlement=SimpleNamespace(tier="standard"),
+        ),
+        capability_state=SimpleNamespace(tier="standard", capabilities={"documents": {}, "exports": []}),
     )
 
     async def fake_build_access_context(_request, _auth_context):
         return fake_access
 
     extension_routes.service.build_access_context = fake_build_access_context
-    return main.app, extension_routes
+    return app, extension_routes
 
 
 @pytest.mark.anyio
@@ -1,41 +1,26 @@
 import importlib
+from types import SimpleNamespace
 
 import pytest
-import supabase
 
+import app.core.auth as core_auth
 from app.core.auth import RequestAuthContext
-from tests.conftest import async_test_client
-
-
-class DummyUser:
-    def __init__(self, user_id: str, email: str = "user@example.com"):
-        self.id = user_id
-        self.email = email
-        self.aud = "authenticated"
-        self.role = "authenticated"
+from tests.conftest import async_test_client, create_app_with_routers, use_supabase_client
+from tests.test_auth_core import DummyClient, DummyUser
 
 
 class ValidAuth:
     def get_user(self, token):
-        return type("DummyResponse", (), {"user": DummyUser("user-1", email=f"{token}@example.com")})
+        return SimpleNamespace(user=DummyUser("user-1", email=f"{token}@example.com"))
 
     def refresh_session(self, refresh_token):
-        session = type(
-            "DummySession",
-            (),
-            {
-                "access_token": "refreshed-access",
-                "refresh_token": refresh_token,
-                "expires_in": 600,
-                "token_type": "bearer",
-            },
-        )()
-        return type("DummyRefresh", (), {"session": session})
-
-
-class DummyClient:
-    def __init__(self, auth):
-        self.auth = auth
+        session = SimpleNamespace(
+            access_token="refreshed-access",
+            refresh_token=refresh_token,
+            expires_in=600,
+            token_type="bearer",
+        )
+        return SimpleNamespace(session=session)
 
 
 class ValidTokenVerifier:
@@ -83,23 +68,16 @@ def _load_app(monkeypatch):
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient(ValidAuth()))
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient(ValidAuth()))
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
     from app.modules.extension import routes as extension_routes
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
     extension_routes = importlib.reload(extension_routes)
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, extension_router=extension_routes.router)
     monkeypatch.setattr(core_auth, "get_token_verifier", lambda: ValidTokenVerifier())
     extension_routes.identity_service.repository = StoredIdentityRepository()
     extension_routes.service.identity_service.repository = StoredIdentityRepository()
-    return main.app, extension_routes
+    return app, extension_routes
 
 
 @pytest.mark.anyio
@@ -256,15 +234,19 @@ async def test_extension_work_in_editor_and_usage_event_use_canonical_endpoints(
 
 
 @pytest.mark.anyio
-async def test_removed_extension_aliases_return_404(monkeypatch):
+@pytest.mark.parametrize(
+    ("path", "payload", "headers"),
+    [
+        ("/api/extension" + "/handoff/issue", {"refresh_token": "refresh-1", "redirect_path": "/editor"}, {"Authorization": "Bearer valid"}),
+        ("/api/extension" + "/handoff/exchange", {"code": "handoff-1"}, {}),
+        ("/api/extension" + "/selection", {"url": "https://example.com/article"}, {"Authorization": "Bearer valid"}),
+        ("/api/extension" + "/usage-event", {"url": "https://example.com/article", "event_id": "123e4567-e89b-42d3-a456-426614174000", "event_type": "unlock"}, {"Authorization": "Bearer valid"}),
+    ],
+)
+async def test_removed_extension_aliases_return_404(monkeypatch, path, payload, headers):
     app, _extension_routes = _load_app(monkeypatch)
 
     async with async_test_client(app) as client:
-        responses = [
-            await client.post("/api/extension" + "/handoff/issue", json={"refresh_token": "refresh-1", "redirect_path": "/editor"}, headers={"Authorization": "Bearer valid"}),
-            await client.post("/api/extension" + "/handoff/exchange", json={"code": "handoff-1"}),
-            await client.post("/api/extension" + "/selection", json={"url": "https://example.com/article"}, headers={"Authorization": "Bearer valid"}),
-            await client.post("/api/extension" + "/usage-event", json={"url": "https://example.com/article", "event_id": "123e4567-e89b-42d3-a456-426614174000", "event_type": "unlock"}, headers={"Authorization": "Bearer valid"}),
-        ]
-
-    assert all(response.status_code == 404 for response in responses)
+        response = await client.post(path, json=payload, headers=headers)
+
+    assert response.status_code == 404
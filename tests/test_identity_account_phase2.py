@@ -1,9 +1,7 @@
-import importlib
-
 import pytest
-import supabase
 
-from tests.conftest import async_test_client
+from tests.conftest import async_test_client, build_test_app
+from tests.test_auth_core import DummyClient, ValidAuth
 
 
 SUPPORTED_PREFERENCE_PATCH_FIELDS = {
@@ -15,24 +13,6 @@ SUPPORTED_PREFERENCE_PATCH_FIELDS = {
 }
 
 
-class DummyUser:
-    def __init__(self, user_id: str, email: str = "user@example.com"):
-        self.id = user_id
-        self.email = email
-        self.aud = "authenticated"
-        self.role = "authenticated"
-
-
-class ValidAuth:
-    def get_user(self, token):
-        return type("DummyResponse", (), {"user": DummyUser("user-1")})
-
-
-class DummyClient:
-    def __init__(self, auth):
-        self.auth = auth
-
-
 class LazyBootstrapIdentityRepository:
     def __init__(self, *, fail_after_bootstrap: bool = False):
         self.profile = None
@@ -120,22 +100,14 @@ def _load_app(monkeypatch, *, identity_repo, billing_repo):
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient(ValidAuth()))
+    app = build_test_app(monkeypatch, lambda url, key: DummyClient(ValidAuth()))
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
     from app.modules.billing import routes as billing_routes
     from app.modules.identity import routes as identity_routes
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
     identity_routes.service.repository = identity_repo
     billing_routes.service.repository = billing_repo
-    return main.app
+    return app
 
 
 @pytest.mark.anyio
@@ -1,6 +1,6 @@
 import asyncio
 
-from app.services.metrics import MetricsStore, record_dependency_call, record_dependency_call_async
+from app.services.metrics import MetricsStore, metrics, record_dependency_call, record_dependency_call_async
 
 
 class _Response:
@@ -16,6 +16,8 @@ def test_metrics_store_percentiles_and_prometheus_output():
 
     assert store.percentile_ms("http.request_latency", 50) == 30
     assert store.percentile_ms("http.request_latency", 95) == 50
+    assert store.percentile_ms("http.request_latency", 99) == 50
+    assert store.percentile_ms("missing", 50) == 0.0
 
     output = store.render_prometheus()
     assert "http_request_count" in output
@@ -23,8 +25,11 @@ def test_metrics_store_percentiles_and_prometheus_output():
 
 
 def test_record_dependency_call_tracks_failures_from_status_codes():
+    before = metrics.counter("dependency.upstash.failure_count")
     result = record_dependency_call("upstash", lambda: _Response(500))
     assert result.status_code == 500
+    assert metrics.counter("dependency.upstash.failure_count") == before + 1
+    assert metrics.percentile_ms("dependency.upstash.latency", 50) >= 0.0
 
 
 async def _ok_async_call():
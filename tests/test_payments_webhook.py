@@ -4,14 +4,8 @@ import importlib
 import json
 
 import pytest
-import supabase
 
-from tests.conftest import async_test_client
-
-
-class DummyClient:
-    def __init__(self):
-        self.auth = type("DummyAuth", (), {"get_user": lambda self, token: type("Resp", (), {"user": None})()})()
+from tests.conftest import anonymous_supabase_client, async_test_client, create_app_with_routers, use_supabase_client
 
 
 class FakeBillingRepository:
@@ -127,25 +121,16 @@ def _load_app(monkeypatch):
     monkeypatch.setenv("PADDLE_PRO_YEARLY_PRICE_ID", "price_pro_yearly")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
+    use_supabase_client(monkeypatch, anonymous_supabase_client)
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    import app.core.errors as core_errors
-    from app import main
     from app.modules.billing import service as billing_service
     from app.modules.billing import routes as billing_routes
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    importlib.reload(core_errors)
     billing_service = importlib.reload(billing_service)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
     billing_routes = importlib.reload(billing_routes)
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, billing_router=billing_routes.router)
     billing_routes.service.repository = FakeBillingRepository()
-    return main.app, billing_routes.service.repository
+    return app, billing_routes.service.repository
 
 
 @pytest.fixture
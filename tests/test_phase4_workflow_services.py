@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from types import SimpleNamespace
 
 import pytest
 from fastapi import HTTPException
@@ -67,7 +68,7 @@ class FakeCitationsService:
             "citation-b": {"id": "citation-b", "source": {"id": "source-b", "title": "Source B"}},
         }
         self.repository = self
-        self.sources_service = type("FakeSourcesService", (), {})()
+        self.sources_service = SimpleNamespace()
 
     async def list_citations(self, *, user_id, access_token, ids=None, limit=50, **kwargs):
         del user_id, access_token, limit, kwargs
@@ -352,7 +353,7 @@ class FakeNotesRepository:
         self.rpc_calls.append((function_name, deepcopy(payload)))
         if function_name == "replace_note_tag_links_atomic":
             self.note_tag_links[payload["p_note_id"]] = list(payload["p_tag_ids"])
-            return type("Resp", (), {"status_code": 200})(), payload["p_tag_ids"]
+            return SimpleNamespace(status_code=200), payload["p_tag_ids"]
         if function_name == "replace_note_sources_atomic":
             stored_rows = [
                 {"id": f"rel-{index}", "note_id": payload["p_note_id"], "relation_type": source.get("target_kind"), "attached_at": f"2026-01-0{index+1}T00:00:00+00:00", **source}
@@ -362,11 +363,11 @@ class FakeNotesRepository:
                 stored_rows,
                 key=lambda row: (row.get("position", 0), row.get("attached_at") or "", row.get("id") or ""),
             )
-            return type("Resp", (), {"status_code": 200})(), payload["p_sources"]
+            return SimpleNamespace(status_code=200), payload["p_sources"]
         if function_name == "replace_note_links_atomic":
             self.note_links[payload["p_note_id"]] = list(payload["p_note_links"])
-            return type("Resp", (), {"status_code": 200})(), payload["p_note_links"]
-        return type("Resp", (), {"status_code": 422, "json": lambda self: {"message": "invalid"}})(), None
+            return SimpleNamespace(status_code=200), payload["p_note_links"]
+        return SimpleNamespace(status_code=422, json=lambda: {"message": "invalid"}), None
 
 
 class FakeQuotesRepository:
@@ -600,7 +601,7 @@ class FakeWorkspaceRepository:
         self.rpc_calls.append((function_name, deepcopy(payload)))
         document_id = payload.get("p_document_id")
         if document_id in self.documents and payload.get("p_expected_revision") != self.documents[document_id]["updated_at"]:
-            return type("Resp", (), {"status_code": 409})(), None
+            return SimpleNamespace(status_code=409), None
         if function_name == "replace_document_citations_atomic":
             self.document_citations[payload["p_document_id"]] = list(payload["p_citation_ids"])
             self.documents[payload["p_document_id"]]["updated_at"] = self._next_revision()
@@ -610,7 +611,7 @@ class FakeWorkspaceRepository:
         elif function_name == "replace_document_tags_atomic":
             self.document_tags[payload["p_document_id"]] = list(payload["p_tag_ids"])
             self.documents[payload["p_document_id"]]["updated_at"] = self._next_revision()
-        return type("Resp", (), {"status_code": 200})(), True
+        return SimpleNamespace(status_code=200), True
 
 
 class FakeNotesServiceForWorkspace:
@@ -934,6 +935,45 @@ async def test_outline_is_derived_read_only_best_effort(workspace_service):
     assert payload["data"]["items"] == [{"level": 1, "text": "Heading", "anchor": "heading"}]
 
 
+@pytest.mark.anyio
+async def test_outline_falls_back_to_html_headings_when_delta_has_none(workspace_service):
+    document = workspace_service.repository.documents[DOC_ID]
+    document["content_delta"] = {"ops": [{"insert": "Body\n"}]}
+    document["content_html"] = '<H2 class="x">Key <em>Findings</em></H2><p>Body</p><h3>Next Steps!</h3>'
+
+    payload = await workspace_service.outline_document(user_id="user-1", access_token=None, document_id=DOC_ID)
+
+    assert payload["data"]["items"] == [
+        {"level": 2, "text": "Key Findings", "anchor": "key-findings"},
+        {"level": 3, "text": "Next Steps!", "anchor": "next-steps"},
+    ]
+
+
+@pytest.mark.anyio
+async def test_outline_skips_unclosed_heading(workspace_service):
+    document = workspace_service.repository.documents[DOC_ID]
+    document["content_delta"] = {"ops": [{"insert": "Body\n"}]}
+    document["content_html"] = "<h2>" + ("a" * 20000) + "<h3>Summary</h3>"
+
+    payload = await workspace_service.outline_document(user_id="user-1", access_token=None, document_id=DOC_ID)
+
+    assert payload["data"]["items"] == [{"level": 3, "text": "Summary", "anchor": "summary"}]
+
+
+@pytest.mark.anyio
+async def test_outline_truncates_long_html_headings_instead_of_dropping_them(workspace_service):
+    document = workspace_service.repository.documents[DOC_ID]
+    document["content_delta"] = {"ops": [{"insert": "Body\n"}]}
+    document["content_html"] = "<h2>" + ("a" * 5000) + "</h2><h3>Summary</h3>"
+
+    payload = await workspace_service.outline_document(user_id="user-1", access_token=None, document_id=DOC_ID)
+
+    items = payload["data"]["items"]
+    assert [item["level"] for item in items] == [2, 3]
+    assert items[0]["text"] == "a" * 4096
+    assert items[1]["text"] == "Summary"
+
+
 @pytest.mark.anyio
 async def test_replace_note_sources_rejects_unowned_source_id_before_rpc(notes_service):
     with pytest.raises(HTTPException) as exc:
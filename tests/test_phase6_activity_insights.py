@@ -6,9 +6,8 @@ from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
-import supabase
 
-from tests.conftest import async_test_client
+from tests.conftest import async_test_client, create_app_with_routers, use_supabase_client
 
 
 class DummyUser:
@@ -21,7 +20,7 @@ class DummyUser:
 
 class ValidAuth:
     def get_user(self, token):
-        return type("DummyResponse", (), {"user": DummyUser("user-1")})
+        return SimpleNamespace(user=DummyUser("user-1"))
 
 
 class DummyClient:
@@ -200,29 +199,22 @@ def _load_app(monkeypatch, *, tier: str = "standard"):
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient())
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
     from app.modules.extension import routes as extension_routes
     from app.modules.insights import routes as insights_routes
     from app.modules.unlock import routes as unlock_routes
 
-    importlib.reload(core_config)
-    importlib.reload(core_auth)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
     unlock_routes = importlib.reload(unlock_routes)
     insights_routes = importlib.reload(insights_routes)
     extension_routes = importlib.reload(extension_routes)
-    main = importlib.reload(main)
+    app = create_app_with_routers(monkeypatch, unlock_router=unlock_routes.router, insights_router=insights_routes.router, extension_router=extension_routes.router)
 
     identity_repo = StoredIdentityRepository(tier=tier)
     unlock_routes.identity_service.repository = identity_repo
     insights_routes.identity_service.repository = identity_repo
     extension_routes.service.identity_service.repository = identity_repo
-    return main.app, unlock_routes, insights_routes, extension_routes
+    return app, unlock_routes, insights_routes, extension_routes
 
 
 @pytest.mark.anyio
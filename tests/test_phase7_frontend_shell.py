@@ -1,21 +1,26 @@
-import importlib
 import re
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
-import supabase
 
-from tests.conftest import async_test_client
+from tests.conftest import async_test_client, build_test_app
+
+
+TOKEN_USERS = {
+    "valid-token": SimpleNamespace(id="user-1", email="user@example.com", aud="authenticated", role="authenticated"),
+}
+
+
+@lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8")
 
 
 class DummyAuth:
     def get_user(self, token):
-        if token == "valid-token":
-            return type(
-                "DummyResponse",
-                (),
-                {"user": type("DummyUser", (), {"id": "user-1", "email": "user@example.com", "aud": "authenticated", "role": "authenticated"})()},
-            )
-        return type("DummyResponse", (), {"user": None})
+        return SimpleNamespace(user=TOKEN_USERS.get(token))
 
 
 class DummyClient:
@@ -23,7 +28,7 @@ class DummyClient:
         self.auth = DummyAuth()
 
 
-def _load_main(monkeypatch):
+def _build_app(monkeypatch):
     monkeypatch.setenv("SUPABASE_URL", "http://example.com")
     monkeypatch.setenv("SUPABASE_KEY", "anon")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
@@ -31,23 +36,13 @@ def _load_main(monkeypatch):
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
 
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
-
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
-
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    return importlib.reload(main)
+    return build_test_app(monkeypatch, lambda url, key: DummyClient())
 
 
 @pytest.mark.anyio
 async def test_public_config_exposes_canonical_boot_keys(monkeypatch):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         response = await client.get("/api/public-config")
 
     assert response.status_code == 200
@@ -67,8 +62,8 @@ async def test_public_config_exposes_canonical_boot_keys(monkeypatch):
     ],
 )
 async def test_shell_routes_render_minimal_boot_metadata(monkeypatch, path, title_fragment, page_id):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         response = await client.get(path)
 
     assert response.status_code == 200
@@ -82,8 +77,8 @@ async def test_shell_routes_render_minimal_boot_metadata(monkeypatch, path, titl
 
 @pytest.mark.anyio
 async def test_route_surface_keeps_expected_public_and_shell_entries(monkeypatch):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         auth = await client.get("/auth")
         compact_auth = await client.get("/auth?source=extension&attempt=attempt-1&next=/dashboard")
         pricing = await client.get("/pricing", follow_redirects=False)
@@ -105,20 +100,20 @@ async def test_route_surface_keeps_expected_public_and_shell_entries(monkeypatch
 
 
 def test_app_root_shell_does_not_reference_legacy_unlock_endpoints():
-    source = open("app/templates/app_home.html", encoding="utf-8").read()
+    source = _read("app/templates/app_home.html")
     assert "/view" not in source
     assert "/fetch_and_clean_page" not in source
 
 
 def test_shell_boot_payload_does_not_embed_entity_collections():
-    template = open("app/templates/app_shell_base.html", encoding="utf-8").read()
+    template = _read("app/templates/app_shell_base.html")
     assert "recent_documents" not in template
     assert "recent_research" not in template
     assert re.search(r'<script id="app-boot" type="application/json">', template)
 
 
 def test_shell_template_exposes_sidebar_controls_for_desktop_and_mobile():
-    template = open("app/templates/app_shell_base.html", encoding="utf-8").read()
+    template = _read("app/templates/app_shell_base.html")
     assert 'id="app-sidebar-toggle"' in template
     assert 'id="app-sidebar-autohide-toggle"' in template
     assert 'id="app-sidebar-mobile-toggle"' in template
@@ -127,8 +122,8 @@ def test_shell_template_exposes_sidebar_controls_for_desktop_and_mobile():
 
 @pytest.mark.anyio
 async def test_editor_route_uses_minimal_shell_header_when_authenticated(monkeypatch):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         session_response = await client.post("/api/auth/session", json={"access_token": "valid-token"})
         assert session_response.status_code == 200
         response = await client.get("/editor")
@@ -141,7 +136,7 @@ async def test_editor_route_uses_minimal_shell_header_when_authenticated(monkeyp
 
 
 def test_editor_template_exposes_compact_document_bar_and_checkpoint_affordances():
-    template = open("app/templates/app_editor.html", encoding="utf-8").read()
+    template = _read("app/templates/app_editor.html")
 
     assert 'class="editor-v2-document-bar"' in template
     assert 'id="editor-checkpoint-status"' in template
@@ -153,14 +148,14 @@ def test_editor_template_exposes_compact_document_bar_and_checkpoint_affordances
 
 
 def test_editor_runtime_keeps_compact_toolbar_toggle_and_hover_preview_modules():
-    app_source = open("app/static/js/editor_v2/core/editor_app.js", encoding="utf-8").read()
-    toolbar_source = open("app/static/js/editor_v2/ui/toolbar_controller.js", encoding="utf-8").read()
-    preview_source = open("app/static/js/editor_v2/ui/explorer_preview.js", encoding="utf-8").read()
-    checkpoint_source = open("app/static/js/editor_v2/document/checkpoint_controller.js", encoding="utf-8").read()
+    app_source = _read("app/static/js/editor_v2/core/editor_app.js")
+    toolbar_source = _read("app/static/js/editor_v2/ui/toolbar_controller.js")
+    preview_source = _read("app/static/js/editor_v2/ui/explorer_preview.js")
+    checkpoint_source = _read("app/static/js/editor_v2/document/checkpoint_controller.js")
 
     assert 'focusTarget: quillAdapter' in app_source
     assert 'summarizeContextMode' in app_source
-    assert 'data-toolbar-group="secondary"' in open("app/templates/app_editor.html", encoding="utf-8").read()
+    assert 'data-toolbar-group="secondary"' in _read("app/templates/app_editor.html")
     assert 'toggle-expand' not in toolbar_source
     assert 'focusTarget.focus?.()' in toolbar_source
     assert 'panel.addEventListener("mouseenter", onPanelEnter)' in preview_source
@@ -169,9 +164,9 @@ def test_editor_runtime_keeps_compact_toolbar_toggle_and_hover_preview_modules()
 
 
 def test_research_shell_uses_separate_card_and_detail_renderers():
-    boot_source = open("app/static/js/app_shell/pages/research.js", encoding="utf-8").read()
-    card_source = open("app/static/js/app_shell/renderers/cards.js", encoding="utf-8").read()
-    detail_source = open("app/static/js/app_shell/renderers/details.js", encoding="utf-8").read()
+    boot_source = _read("app/static/js/app_shell/pages/research.js")
+    card_source = _read("app/static/js/app_shell/renderers/cards.js")
+    detail_source = _read("app/static/js/app_shell/renderers/details.js")
 
     assert 'from "../renderers/cards.js"' in boot_source
     assert 'from "../renderers/details.js"' in boot_source
@@ -180,8 +175,8 @@ def test_research_shell_uses_separate_card_and_detail_renderers():
 
 
 def test_research_selection_uses_canonical_graph_endpoint_for_context_neighborhoods():
-    source = open("app/static/js/app_shell/pages/research.js", encoding="utf-8").read()
-    detail_source = open("app/static/js/app_shell/renderers/details.js", encoding="utf-8").read()
+    source = _read("app/static/js/app_shell/pages/research.js")
+    detail_source = _read("app/static/js/app_shell/renderers/details.js")
     assert "/api/research/${encodeURIComponent(type)}/${encodeURIComponent(id)}/graph" in source
     assert "renderGraphDetail" in source
     assert "data-related-entity-id" in detail_source
@@ -190,10 +185,10 @@ def test_research_selection_uses_canonical_graph_endpoint_for_context_neighborho
 
 
 def test_phase7_runtime_avoids_legacy_cookie_and_dashboard_fetch_paths():
-    auth_source = open("app/static/js/auth.js", encoding="utf-8").read()
-    dashboard_source = open("app/static/js/app_shell/pages/dashboard.js", encoding="utf-8").read()
-    auth_template = open("app/templates/auth.html", encoding="utf-8").read()
-    handoff_template = open("app/templates/auth_handoff.html", encoding="utf-8").read()
+    auth_source = _read("app/static/js/auth.js")
+    dashboard_source = _read("app/static/js/app_shell/pages/dashboard.js")
+    auth_template = _read("app/templates/auth.html")
+    handoff_template = _read("app/templates/auth_handoff.html")
 
     assert "WRITIOR_SUPABASE_URL" in auth_source
     assert "persistSession: false" in auth_source
@@ -210,12 +205,12 @@ def test_phase7_runtime_avoids_legacy_cookie_and_dashboard_fetch_paths():
 
 
 def test_projects_surface_requests_explicit_limited_project_list():
-    source = open("app/static/js/app_shell/pages/projects.js", encoding="utf-8").read()
+    source = _read("app/static/js/app_shell/pages/projects.js")
     assert "/api/projects?include_archived=false&limit=24" in source
 
 
 def test_research_selection_does_not_force_list_refetch_on_same_dataset():
-    source = open("app/static/js/app_shell/pages/research.js", encoding="utf-8").read()
+    source = _read("app/static/js/app_shell/pages/research.js")
     assert "function selectItem(id)" in source
     assert "refreshListSelection();" in source
     assert "loadDetail(id);" in source
@@ -224,14 +219,14 @@ def test_research_selection_does_not_force_list_refetch_on_same_dataset():
 
 
 def test_research_popstate_reuses_current_list_when_only_selection_changes():
-    source = open("app/static/js/app_shell/pages/research.js", encoding="utf-8").read()
+    source = _read("app/static/js/app_shell/pages/research.js")
     assert "if (datasetKey(state) === activeDatasetKey && latestListItems.length)" in source
     assert "loadList();" in source
 
 
 def test_research_list_supports_truthful_load_more_and_unwrapped_meta():
-    source = open("app/static/js/app_shell/pages/research.js", encoding="utf-8").read()
-    fetch_source = open("app/static/js/app_shell/core/fetch.js", encoding="utf-8").read()
+    source = _read("app/static/js/app_shell/pages/research.js")
+    fetch_source = _read("app/static/js/app_shell/core/fetch.js")
     assert "data-research-load-more" in source
     assert "currentMeta = payload?.meta" in source
     assert "unwrapEnvelope: false" in source
@@ -239,8 +234,8 @@ def test_research_list_supports_truthful_load_more_and_unwrapped_meta():
 
 
 def test_research_tablist_has_keyboard_navigation_hooks():
-    template = open("app/templates/app_research.html", encoding="utf-8").read()
-    source = open("app/static/js/app_shell/pages/research.js", encoding="utf-8").read()
+    template = _read("app/templates/app_research.html")
+    source = _read("app/static/js/app_shell/pages/research.js")
     assert 'role="tablist"' in template
     assert 'aria-controls="research-list-region"' in template
     assert 'event.key === "ArrowRight"' in source
@@ -250,9 +245,9 @@ def test_research_tablist_has_keyboard_navigation_hooks():
 
 
 def test_research_filter_controls_are_honest_about_project_and_tag_support():
-    template = open("app/templates/app_research.html", encoding="utf-8").read()
-    source = open("app/static/js/app_shell/pages/research.js", encoding="utf-8").read()
-    quotes_service = open("app/modules/research/quotes/service.py", encoding="utf-8").read()
+    template = _read("app/templates/app_research.html")
+    source = _read("app/static/js/app_shell/pages/research.js")
+    quotes_service = _read("app/modules/research/quotes/service.py")
     assert 'id="research-filter-hint"' in template
     assert "projectInput.disabled = !config.supportsProject" in source
     assert "tagInput.disabled = !config.supportsTag" in source
@@ -260,22 +255,22 @@ def test_research_filter_controls_are_honest_about_project_and_tag_support():
 
 
 def test_projects_api_supports_explicit_limit_parameter():
-    route_source = open("app/modules/research/routes.py", encoding="utf-8").read()
-    service_source = open("app/modules/research/taxonomy/service.py", encoding="utf-8").read()
-    repo_source = open("app/modules/research/taxonomy/repo.py", encoding="utf-8").read()
+    route_source = _read("app/modules/research/routes.py")
+    service_source = _read("app/modules/research/taxonomy/service.py")
+    repo_source = _read("app/modules/research/taxonomy/repo.py")
     assert "limit: int = Query(default=24, le=100)" in route_source
     assert "limit=limit" in service_source
     assert '"limit": str(limit)' in repo_source
 
 
 def test_auth_handoff_page_is_minimal_success_fallback_not_bridge_wait():
-    handoff_source = open("app/templates/auth_handoff.html", encoding="utf-8").read()
+    handoff_source = _read("app/templates/auth_handoff.html")
     assert "Sign-in complete" in handoff_source
     assert "Retry sign-in" in handoff_source
     assert "Waiting for extension bridge timed out" not in handoff_source
 
 
 def test_research_routes_expose_cursor_pagination_for_all_knowledge_tabs():
-    route_source = open("app/modules/research/routes.py", encoding="utf-8").read()
+    route_source = _read("app/modules/research/routes.py")
     assert "cursor: str | None = None" in route_source
     assert "serialize_ok_envelope(page[\"items\"], meta=page[\"meta\"])" not in route_source
@@ -1,9 +1,10 @@
 import importlib
+from types import SimpleNamespace
 
 import pytest
-import supabase
 
-from tests.conftest import async_test_client
+import app.core.security as core_security
+from tests.conftest import async_test_client, create_app_with_routers, use_supabase_client
 from tests.test_auth_core import DummyClient, ValidAuth
 
 
@@ -22,19 +23,15 @@ class FakeSharedRateLimitRepository:
         assert function_name == "hit_auth_rate_limit"
         self.__class__.calls.append(dict(json or {}))
         allowed, aux = self.__class__.decisions.pop(0) if self.__class__.decisions else (True, 0)
-        return type(
-            "Response",
-            (),
-            {
-                "json": lambda _self: [
-                    {
-                        "allowed": allowed,
-                        "retry_after": aux,
-                        "remaining": aux if allowed else 0,
-                    }
-                ]
-            },
-        )()
+        return SimpleNamespace(
+            json=lambda: [
+                {
+                    "allowed": allowed,
+                    "retry_after": aux,
+                    "remaining": aux if allowed else 0,
+                }
+            ]
+        )
 
 
 def _load_app(monkeypatch):
@@ -43,22 +40,14 @@ def _load_app(monkeypatch):
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient(ValidAuth()))
+    use_supabase_client(monkeypatch, lambda url, key: DummyClient(ValidAuth()))
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    import app.core.security as core_security
-    from app import main
     from app.modules.identity import routes as identity_routes
 
-    importlib.reload(core_config)
-    importlib.reload(core_auth)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
     monkeypatch.setattr(core_security, "SupabaseRestRepository", FakeSharedRateLimitRepository)
     identity_routes = importlib.reload(identity_routes)
-    main = importlib.reload(main)
-    return main.app, identity_routes
+    app = create_app_with_routers(monkeypatch, identity_router=identity_routes.router)
+    return app, identity_routes
 
 
 @pytest.mark.anyio
@@ -1,22 +1,9 @@
-import importlib
-
 import pytest
-import supabase
-
-from tests.conftest import async_test_client
-
-
-class DummyAuth:
-    def get_user(self, token):
-        return type("DummyResponse", (), {"user": None})
 
+from tests.conftest import anonymous_supabase_client, async_test_client, build_test_app
 
-class DummyClient:
-    def __init__(self):
-        self.auth = DummyAuth()
 
-
-def _load_main(monkeypatch):
+def _build_app(monkeypatch):
     monkeypatch.setenv("SUPABASE_URL", "http://example.com")
     monkeypatch.setenv("SUPABASE_ANON_KEY", "anon")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
@@ -24,25 +11,15 @@ def _load_main(monkeypatch):
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
     monkeypatch.setenv("PADDLE_WEBHOOK_SECRET", "whsec_test")
 
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
-
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
-
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    return importlib.reload(main)
+    return build_test_app(monkeypatch, anonymous_supabase_client)
 
 
 @pytest.mark.anyio
 async def test_request_id_is_returned_and_logged(monkeypatch, caplog):
-    main = _load_main(monkeypatch)
+    app = _build_app(monkeypatch)
 
     request_id = "req-test-123"
-    async with async_test_client(main.app) as client:
+    async with async_test_client(app) as client:
         response = await client.get("/api/public-config", headers={"X-Request-Id": request_id})
 
     assert response.status_code == 200
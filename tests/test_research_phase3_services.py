@@ -2,6 +2,7 @@ import pytest
 from fastapi import HTTPException
 
 from app.modules.research.citations.service import CitationsService
+from app.modules.research.quotes.service import QuotesService
 from app.modules.research.sources.service import SourcesService
 from app.modules.research.taxonomy.service import TaxonomyService
 from app.services.citation_domain import ExtractionCandidate, ExtractionPayload, build_source_fingerprint
@@ -1105,3 +1106,21 @@ async def test_citation_list_keeps_rows_when_source_enrichment_is_missing(citati
     assert rows[0]["id"] == created["id"]
     assert rows[0]["source"]["id"] == created["source_id"]
     assert rows[0]["excerpt"] == "Gap excerpt"
+
+
+def test_quote_query_filter_is_case_insensitive_and_literal():
+    rows = [
+        {"excerpt": "Growth in Q3 (2024) was FLAT", "citation": {"source": {"title": "Annual report"}}},
+        {"excerpt": "Unrelated", "citation": {"source": {"title": "Growth In Q3 (2024) review"}}},
+        {"excerpt": "Growth in Q3 2024", "citation": {"source": {"title": None}}},
+    ]
+
+    filtered = QuotesService._filter_serialized_quotes_by_query(rows=rows, query="  growth in q3 (2024) ")
+
+    assert filtered == rows[:2]
+
+
+def test_quote_query_filter_matches_unicode_lowercase_forms():
+    rows = [{"excerpt": "Notes from İstanbul", "citation": {"source": {"title": None}}}]
+
+    assert QuotesService._filter_serialized_quotes_by_query(rows=rows, query="İstanbul".lower()) == rows
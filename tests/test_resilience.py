@@ -0,0 +1,124 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.routes.http import ResilientAsyncClient
+from app.services import resilience
+from app.services.resilience import CircuitBreaker, RetryPolicy, _backoff_schedule, _compute_backoff
+
+
+def test_backoff_schedule_doubles_per_attempt_and_caps_at_max_delay():
+    policy = RetryPolicy(max_attempts=5, base_delay_s=0.2, max_delay_s=1.0, jitter_s=0.0)
+
+    assert _backoff_schedule(policy) == (0.2, 0.4, 0.8, 1.0, 1.0)
+    assert _backoff_schedule(policy) is _backoff_schedule(policy)
+
+
+def test_compute_backoff_adds_bounded_jitter(monkeypatch):
+    policy = RetryPolicy(max_attempts=3, base_delay_s=0.2, max_delay_s=1.0, jitter_s=0.25)
+
+    monkeypatch.setattr(resilience._JITTER_RNG, "random", lambda: 0.0)
+    assert _compute_backoff(2, policy) == 0.4
+
+    monkeypatch.setattr(resilience._JITTER_RNG, "random", lambda: 0.999)
+    assert 0.4 < _compute_backoff(2, policy) < 0.4 + 0.25
+    assert _compute_backoff(10, policy) < 1.0 + 0.25
+
+
+def test_circuit_breaker_opens_after_threshold_and_resets_on_success(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(resilience.time, "monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_s=30.0)
+
+    breaker.record_failure("api.example.com")
+    assert breaker.is_open("api.example.com") is False
+    breaker.record_failure("api.example.com")
+    assert breaker.is_open("api.example.com") is True
+    assert breaker.is_open("other.example.com") is False
+
+    now[0] += 31.0
+    assert breaker.is_open("api.example.com") is False
+
+    breaker.record_success("api.example.com")
+    breaker.record_failure("api.example.com")
+    assert breaker.is_open("api.example.com") is False
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    async def no_sleep(_delay):
+        return None
+
+    monkeypatch.setattr(resilience.asyncio, "sleep", no_sleep)
+
+
+def _client(handler, breaker: CircuitBreaker, *, max_attempts: int, base_url: str = "") -> ResilientAsyncClient:
+    return ResilientAsyncClient(
+        base_url=base_url,
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=max_attempts, base_delay_s=0.0, max_delay_s=0.0, jitter_s=0.0),
+        circuit_breaker=breaker,
+    )
+
+
+def test_resilient_client_skips_retries_while_host_breaker_is_open(no_backoff):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.host)
+        return httpx.Response(503)
+
+    async def run():
+        async with _client(handler, CircuitBreaker(failure_threshold=1, cooldown_s=60.0), max_attempts=3) as client:
+            first = await client.get("https://upstream.example.com/health")
+            second = await client.get("https://upstream.example.com/health")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.status_code == 503
+    assert second.status_code == 503
+    assert calls == ["upstream.example.com"] * 4
+
+
+@pytest.mark.parametrize("status_code", [429, 500])
+def test_resilient_client_keeps_retrying_through_rate_limits_and_app_errors(no_backoff, status_code):
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(status_code)
+
+    breaker = CircuitBreaker(failure_threshold=1, cooldown_s=60.0)
+
+    async def run():
+        async with _client(handler, breaker, max_attempts=2, base_url="https://upstream.example.com") as client:
+            await client.get("/rest/v1/noisy")
+            await client.get("/rest/v1/noisy")
+
+    asyncio.run(run())
+
+    assert calls == ["/rest/v1/noisy"] * 4
+    assert breaker.is_open("upstream.example.com") is False
+
+
+def test_resilient_client_keys_relative_requests_by_base_url_host(no_backoff):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/down":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(503)
+
+    breaker = CircuitBreaker(failure_threshold=2, cooldown_s=60.0)
+
+    async def run():
+        async with _client(handler, breaker, max_attempts=1, base_url="https://upstream.example.com") as client:
+            try:
+                await client.get("/down")
+            except httpx.ConnectError:
+                pass
+            await client.get("/error")
+
+    asyncio.run(run())
+
+    assert breaker.is_open("upstream.example.com") is True
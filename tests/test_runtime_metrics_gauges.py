@@ -1,3 +1,5 @@
+import asyncio
+
 from app.services.metrics import MetricsStore
 from app.services.priority_limiter import PriorityLimiter
 
@@ -17,3 +19,41 @@ def test_priority_limiter_exposes_queue_depth_and_in_flight():
 
     assert limiter.queue_depth == 0
     assert limiter.in_flight == 0
+
+
+def test_priority_limiter_returns_slot_granted_to_cancelled_waiter():
+    async def run():
+        limiter = PriorityLimiter(1)
+        await limiter.acquire(0)
+        waiter = asyncio.create_task(limiter.acquire(0))
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 1
+
+        await limiter.release()
+        waiter.cancel()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+        return limiter
+
+    limiter = asyncio.run(run())
+
+    assert limiter.in_flight == 0
+    assert limiter.queue_depth == 0
+
+
+def test_priority_limiter_wakes_waiters_when_concurrency_grows():
+    async def run():
+        limiter = PriorityLimiter(1)
+        await limiter.acquire(0)
+        waiter = asyncio.create_task(limiter.acquire(0))
+        await asyncio.sleep(0)
+
+        await limiter.set_max_concurrency(2)
+        await asyncio.wait_for(waiter, timeout=1)
+        return limiter
+
+    limiter = asyncio.run(run())
+
+    assert limiter.in_flight == 2
@@ -1,19 +1,6 @@
-import importlib
-
 import pytest
-import supabase
-
-from tests.conftest import async_test_client
-
-
-class DummyAuth:
-    def get_user(self, token):
-        return type("DummyResponse", (), {"user": None})
 
-
-class DummyClient:
-    def __init__(self):
-        self.auth = DummyAuth()
+from tests.conftest import anonymous_supabase_client, async_test_client, build_test_app
 
 
 EXPECTED_SECURITY_HEADERS = {
@@ -24,7 +11,7 @@ EXPECTED_SECURITY_HEADERS = {
 }
 
 
-def _load_main(monkeypatch):
+def _build_app(monkeypatch):
     monkeypatch.setenv("SUPABASE_URL", "http://example.com")
     monkeypatch.setenv("SUPABASE_ANON_KEY", "anon")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
@@ -32,23 +19,13 @@ def _load_main(monkeypatch):
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
     monkeypatch.setenv("PADDLE_WEBHOOK_SECRET", "whsec_test")
 
-    monkeypatch.setattr(supabase, "create_client", lambda url, key: DummyClient())
-
-    import app.core.auth as core_auth
-    import app.core.config as core_config
-    from app import main
-
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    return importlib.reload(main)
+    return build_test_app(monkeypatch, anonymous_supabase_client)
 
 
 @pytest.mark.anyio
 async def test_security_headers_added_to_success_response(monkeypatch):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         response = await client.get("/api/public-config")
 
     assert response.status_code == 200
@@ -58,8 +35,8 @@ async def test_security_headers_added_to_success_response(monkeypatch):
 
 @pytest.mark.anyio
 async def test_security_headers_added_to_error_response(monkeypatch):
-    main = _load_main(monkeypatch)
-    async with async_test_client(main.app) as client:
+    app = _build_app(monkeypatch)
+    async with async_test_client(app) as client:
         response = await client.get("/api/me")
 
     assert response.status_code == 401
@@ -62,16 +62,19 @@ def test_route_classifier_is_authoritative_for_mounted_v2_routes():
     assert classifier.classify("/api/me") == RouteAccess.AUTH_REQUIRED
     assert classifier.classify("/api/projects") == RouteAccess.AUTH_REQUIRED
     assert classifier.classify("/api/docs/doc-1") == RouteAccess.AUTH_REQUIRED
+    assert classifier.classify("/api/extension/captures") == RouteAccess.AUTH_REQUIRED
+    assert classifier.classify("/api/citations?limit=5") == RouteAccess.AUTH_REQUIRED
     assert classifier.classify("/api/research/status") == RouteAccess.PUBLIC
     assert classifier.classify("/api/workspace/status") == RouteAccess.PUBLIC
     assert classifier.classify("/api/unknown") == RouteAccess.PUBLIC
+    assert get_route_classifier() is classifier
 
 
 def test_redirect_validation_rejects_unsafe_targets_and_normalizes_empty():
     assert validate_internal_redirect_path(None) == "/dashboard"
     assert validate_internal_redirect_path("/editor?doc=abc") == "/editor?doc=abc"
 
-    for value in ("https://evil.example.com", "//evil.example.com", "\\evil", "javascript:alert(1)", "/bad\npath"):
+    for value in ("https://evil.example.com", "//evil.example.com", "\\evil", "javascript:alert(1)", "/bad\npath", "/bad\x00path"):
         with pytest.raises(Exception):
             validate_internal_redirect_path(value)
 
@@ -141,6 +144,25 @@ def test_logging_redaction_removes_tokens_and_secrets():
     assert "[REDACTED]" in redacted["message"]
 
 
+def test_logging_redaction_scrubs_every_secret_in_a_single_string():
+    message = "Bearer abc.def== token=t1&next=/editor refresh_token=r1 secret=s1 code=c1"
+
+    redacted = redact_value(message)
+
+    assert redacted == (
+        "Bearer [REDACTED] token=[REDACTED]&next=/editor refresh_token=[REDACTED] "
+        "secret=[REDACTED] code=[REDACTED]"
+    )
+    assert redact_value("token=Bearer eyJhbGci.secretpayload.sig") == "token=[REDACTED] [REDACTED]"
+    assert redact_value("code=Bearer abc.def") == "code=[REDACTED] [REDACTED]"
+
+
+def test_logging_redaction_prefilter_matches_unicode_case_folds():
+    # U+017F (long s) and U+212A (Kelvin sign) fold to "s" and "k" under the (?i) patterns.
+    assert redact_value("\u017fecret=s1") == "\u017fecret=[REDACTED]"
+    assert redact_value("to\u212aen=t1") == "to\u212aen=[REDACTED]"
+
+
 def test_auth_logging_redacts_tokens(caplog):
     caplog.set_level("INFO")
     log_auth_event(token="Bearer abc.def.ghi", refresh_token="refresh123")
@@ -5,13 +5,14 @@ from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
-import supabase
 
+import app.modules.extension.service as extension_service_module
 from app.core.config import RateLimitSettings, Settings, get_settings
 from app.modules.extension.schemas import HandoffExchangeRequest
 from app.modules.extension.service import ExtensionService
 from app.modules.identity.schemas import SignupRequest
 from app.modules.identity.service import IdentityService
+from tests.conftest import use_supabase_client
 
 
 class FakeIdentityRepository:
@@ -170,21 +171,15 @@ def test_app_modules_import_without_constructing_supabase_clients(monkeypatch):
     def boom(*_args, **_kwargs):
         raise AssertionError("create_client should not run during module import")
 
-    monkeypatch.setattr(supabase, "create_client", boom)
+    use_supabase_client(monkeypatch, boom)
 
-    import app.core.auth as core_auth
-    import app.core.config as core_config
     from app import main
     from app.modules.extension import routes as extension_routes
     from app.modules.identity import routes as identity_routes
 
-    importlib.reload(core_auth)
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    core_auth.get_token_verifier.cache_clear()
-    main = importlib.reload(main)
     extension_routes = importlib.reload(extension_routes)
     identity_routes = importlib.reload(identity_routes)
+    main = importlib.reload(main)
 
     assert main.app is not None
     assert extension_routes.service is not None
@@ -209,14 +204,11 @@ async def test_identity_service_builds_admin_client_lazily(monkeypatch):
     monkeypatch.setenv("SUPABASE_ANON_KEY", "anon")
     monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "service")
     monkeypatch.setenv("ENV", "test")
-    monkeypatch.setattr(supabase, "create_client", fake_create_client)
+    get_settings.cache_clear()
 
-    import app.core.config as core_config
     import app.modules.identity.service as identity_service_module
 
-    importlib.reload(core_config)
-    core_config.get_settings.cache_clear()
-    importlib.reload(identity_service_module)
+    monkeypatch.setattr(identity_service_module, "create_client", fake_create_client)
 
     service = IdentityService(repository=FakeIdentityRepository())
     await service.signup(SignupRequest(email="test@example.com", password="password123", display_name="Test User", use_case="research"))
@@ -249,8 +241,6 @@ async def test_extension_service_builds_auth_client_lazily(monkeypatch):
         created.append((url, key))
         return LazyAuthClient()
 
-    import app.modules.extension.service as extension_service_module
-
     monkeypatch.setattr(extension_service_module, "create_client", fake_create_client)
 
     service = ExtensionService(
@@ -286,9 +276,7 @@ async def test_missing_supabase_settings_fail_explicitly_for_lazy_clients(monkey
     monkeypatch.setenv("ENV", "test")
     monkeypatch.setenv("CORS_ORIGINS", "https://app.writior.com")
 
-    import app.core.config as core_config
-
-    core_config.get_settings.cache_clear()
+    get_settings.cache_clear()
 
     identity = IdentityService(repository=FakeIdentityRepository())
     with pytest.raises(RuntimeError, match="Supabase admin settings are incomplete"):
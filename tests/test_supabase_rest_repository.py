@@ -1,6 +1,7 @@
 from fastapi import HTTPException
 import pytest
 
+import app.services.supabase_rest as supabase_rest
 from app.services.supabase_rest import SupabaseRestRepository
 
 
@@ -34,13 +35,22 @@ async def test_headers_include_auth_and_prefer():
     assert headers["Prefer"] == "return=representation"
 
 
+def test_headers_return_independent_copies():
+    repo = SupabaseRestRepository(base_url="https://demo.supabase.co", service_role_key="service-key")
+
+    first = repo.headers(prefer="return=minimal")
+    second = repo.headers(include_content_type=False)
+
+    assert "Prefer" not in repo.headers()
+    assert second == {"apikey": "service-key", "Authorization": "Bearer service-key"}
+    assert first is not repo.headers(prefer="return=minimal")
+
+
 @pytest.mark.anyio
 async def test_request_builds_rest_v1_resource_url(monkeypatch):
     repo = SupabaseRestRepository(base_url="https://demo.supabase.co", service_role_key="service-key")
     fake_client = FakeClient()
 
-    import app.services.supabase_rest as supabase_rest
-
     monkeypatch.setattr(supabase_rest, "http_client", fake_client)
 
     response = await repo.get("user_profiles", params={"limit": 1}, headers=repo.headers())
@@ -54,8 +64,6 @@ async def test_rpc_builds_rest_v1_rpc_url(monkeypatch):
     repo = SupabaseRestRepository(base_url="https://demo.supabase.co", service_role_key="service-key")
     fake_client = FakeClient()
 
-    import app.services.supabase_rest as supabase_rest
-
     monkeypatch.setattr(supabase_rest, "http_client", fake_client)
 
     response = await repo.rpc("replace_document_tags_atomic", json={"p_user_id": "user-1"}, headers=repo.headers())